@@ -40,6 +40,36 @@ class Settings(BaseSettings):
     # Password reset
     RESET_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # =========================
+    # Rate limiting
+    # =========================
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"  # "memory" (per process) or "redis" (shared)
+    RATE_LIMIT_REDIS_URL: str = "redis://localhost:6379/1"
+    RATE_LIMIT_MAX_KEYS: int = 100_000
+    # Only enable behind a proxy that sets X-Forwarded-For (otherwise clients can spoof it)
+    RATE_LIMIT_TRUST_FORWARDED: bool = False
+
+    # =========================
+    # Live dashboard (SSE)
+    # =========================
+    EVENTS_BACKEND: str = "memory"  # "memory" (single worker) or "redis" (fan-out across workers)
+    EVENTS_REDIS_URL: str = "redis://localhost:6379/2"
+    EVENTS_KEEPALIVE_SECONDS: int = 25
+
+    # =========================
+    # Portfolio analytics
+    # =========================
+    RISK_FREE_RATE: float = 0.06  # annual, used for Sharpe ratio
+
+    # =========================
+    # Background jobs
+    # =========================
+    # In-process scheduler tick (seconds), 0 disables it.
+    # Recurring rules and transactions are in-memory per process, so this is
+    # the only scheduler; a Celery job needs them in the DB first.
+    RECURRING_TICK_SECONDS: int = 3600
+
     # =========================
     # App metadata
     # =========================
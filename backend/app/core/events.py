@@ -0,0 +1,194 @@
+import asyncio
+import logging
+import threading
+from typing import Iterable, Optional
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """
+    One live connection. Holds just a flag, not a queue: several changes
+    between two sends collapse into a single wake-up, so an idle or slow
+    client costs one Event no matter how much is written.
+    """
+
+    def __init__(self, keys: Iterable[str], loop: asyncio.AbstractEventLoop):
+        self.keys = frozenset(keys)
+        self._loop = loop
+        self._changed = asyncio.Event()
+
+    def notify(self) -> None:
+        # publishers are mostly sync handlers running in the threadpool
+        try:
+            self._loop.call_soon_threadsafe(self._changed.set)
+        except RuntimeError:
+            pass  # loop already closed, connection is gone
+
+    async def wait(self, timeout: float) -> bool:
+        """
+        True if something changed, False on timeout.
+        """
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._changed.clear()
+        return True
+
+
+class EventBus:
+    """
+    In-process pub/sub keyed by user id. `publish` goes through the backend so
+    other workers hear about it too; the backend calls `notify_local` here.
+    """
+
+    def __init__(self):
+        self._subs: dict[str, set[Subscription]] = {}
+        self._lock = threading.Lock()
+        self.backend = None
+
+    def subscribe(self, keys: Iterable[str]) -> Subscription:
+        sub = Subscription(keys, asyncio.get_running_loop())
+        with self._lock:
+            for key in sub.keys:
+                self._subs.setdefault(key, set()).add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            for key in sub.keys:
+                subs = self._subs.get(key)
+                if subs is not None:
+                    subs.discard(sub)
+                    if not subs:
+                        del self._subs[key]
+
+    def notify_local(self, key: str) -> None:
+        with self._lock:
+            subs = list(self._subs.get(key, ()))
+        for sub in subs:
+            sub.notify()
+
+    def publish(self, key: str) -> None:
+        self.backend.publish(key)
+
+    def connection_count(self) -> int:
+        with self._lock:
+            return len({sub for subs in self._subs.values() for sub in subs})
+
+
+class InMemoryEventBackend:
+    """
+    Single worker: publish goes straight to local subscribers.
+    """
+
+    def __init__(self, bus: EventBus):
+        self.bus = bus
+
+    def publish(self, key: str) -> None:
+        self.bus.notify_local(key)
+
+    async def run(self) -> None:
+        return None
+
+
+class RedisEventBackend:
+    """
+    Multiple workers: every publish goes through one Redis channel and each
+    worker's listener forwards it to its own local subscribers.
+    """
+
+    def __init__(
+        self,
+        bus: EventBus,
+        url: str,
+        channel: str = "wealth:changes",
+        min_backoff: float = 1.0,
+        max_backoff: float = 30.0,
+    ):
+        import redis  # only needed when this backend is selected
+        import redis.asyncio as aioredis
+
+        self.bus = bus
+        self.url = url
+        self.channel = channel
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self._client = redis.Redis.from_url(url)
+        self._async_client = aioredis.Redis.from_url(url)
+        self._pending: set[asyncio.Task] = set()
+
+    def publish(self, key: str) -> None:
+        # a missed live update is not worth failing the write that caused it
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # threadpool (sync handlers): blocking this thread is fine
+            try:
+                self._client.publish(self.channel, key)
+            except Exception:
+                logger.exception("Publishing change for %s failed", key)
+            return
+
+        # on the event loop: never block it on Redis
+        task = loop.create_task(self._publish_async(key))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _publish_async(self, key: str) -> None:
+        try:
+            await self._async_client.publish(self.channel, key)
+        except Exception:
+            logger.exception("Publishing change for %s failed", key)
+
+    async def _listen(self, on_subscribed) -> None:
+        pubsub = self._async_client.pubsub()
+        try:
+            await pubsub.subscribe(self.channel)
+            on_subscribed()
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    self.bus.notify_local(message["data"].decode())
+        finally:
+            await pubsub.aclose()
+
+    async def run(self) -> None:
+        """
+        Listener for the app's lifetime: reconnects with exponential backoff,
+        so a Redis restart only pauses live updates instead of ending them.
+        """
+        backoff = self.min_backoff
+
+        def reset():
+            nonlocal backoff
+            backoff = self.min_backoff
+
+        while True:
+            try:
+                await self._listen(reset)
+                logger.warning("Redis event listener disconnected, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Redis event listener failed, retrying in %.0fs", backoff)
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+
+
+bus = EventBus()
+bus.backend = (
+    RedisEventBackend(bus, settings.EVENTS_REDIS_URL)
+    if settings.EVENTS_BACKEND == "redis"
+    else InMemoryEventBackend(bus)
+)
+
+
+def publish_change(user_id: Optional[object]) -> None:
+    """
+    Tell live dashboards of this user that their data changed.
+    """
+    if user_id is not None:
+        bus.publish(str(user_id))
@@ -0,0 +1,197 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from fastapi import HTTPException, status
+from starlette.responses import JSONResponse
+
+from .config import settings
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    capacity: int          # burst size
+    per_minute: float      # sustained refill rate
+
+    @property
+    def refill_per_second(self) -> float:
+        return self.per_minute / 60.0
+
+
+# ✅ Per-IP limits, enforced by the middleware before the request body is even parsed
+IP_LIMITS: dict[str, RateLimit] = {
+    "/auth/login": RateLimit(capacity=20, per_minute=10),
+    "/auth/register": RateLimit(capacity=5, per_minute=2),
+    "/auth/forgot-password": RateLimit(capacity=5, per_minute=2),
+}
+
+# ✅ Per-account limits, enforced in the handler before the DB lookup / hashing
+ACCOUNT_LIMITS: dict[str, RateLimit] = {
+    "login": RateLimit(capacity=5, per_minute=5),
+    "forgot-password": RateLimit(capacity=3, per_minute=1),
+}
+
+
+class InMemoryRateLimitBackend:
+    """
+    Token buckets in an LRU-ordered dict: O(1) per check, at most `max_keys`
+    buckets. The least recently seen (idle) keys are evicted first; an evicted
+    key simply starts again with a full bucket.
+    """
+
+    def __init__(self, max_keys: int = 100_000, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        self._buckets: "OrderedDict[str, tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def consume(self, key: str, limit: RateLimit) -> float:
+        """
+        Takes one token. Returns 0 if allowed, otherwise seconds until a token is available.
+        """
+        now = self.clock()
+        rate = limit.refill_per_second
+        with self._lock:
+            tokens, last = self._buckets.pop(key, (float(limit.capacity), now))
+            tokens = min(float(limit.capacity), tokens + (now - last) * rate)
+
+            retry_after = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                retry_after = (1 - tokens) / rate
+
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return retry_after
+
+    async def consume_async(self, key: str, limit: RateLimit) -> float:
+        # no I/O, safe to run on the event loop
+        return self.consume(key, limit)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+# Same algorithm as the in-memory backend, run atomically inside Redis.
+# Keys expire once the bucket would be full again, so idle keys clean themselves up.
+_REDIS_TOKEN_BUCKET = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local b = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(b[1]) or capacity
+local ts = tonumber(b[2]) or now
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+local retry_after = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+else
+  retry_after = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+return tostring(retry_after)
+"""
+
+
+class RedisRateLimitBackend:
+    """
+    Shared backend so limits hold across workers / instances.
+    `consume` (sync client) is for the per-account check in sync handlers;
+    the middleware uses `consume_async` so it never blocks the event loop.
+    """
+
+    def __init__(self, url: str, prefix: str = "ratelimit:"):
+        import redis  # only needed when this backend is selected
+        import redis.asyncio as aioredis
+
+        self.prefix = prefix
+        self._script = redis.Redis.from_url(url).register_script(_REDIS_TOKEN_BUCKET)
+        self._async_script = aioredis.Redis.from_url(url).register_script(_REDIS_TOKEN_BUCKET)
+
+    def consume(self, key: str, limit: RateLimit) -> float:
+        result = self._script(
+            keys=[self.prefix + key],
+            args=[limit.capacity, limit.refill_per_second],
+        )
+        return float(result)
+
+    async def consume_async(self, key: str, limit: RateLimit) -> float:
+        result = await self._async_script(
+            keys=[self.prefix + key],
+            args=[limit.capacity, limit.refill_per_second],
+        )
+        return float(result)
+
+
+def _build_backend():
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        return RedisRateLimitBackend(settings.RATE_LIMIT_REDIS_URL)
+    return InMemoryRateLimitBackend(max_keys=settings.RATE_LIMIT_MAX_KEYS)
+
+
+backend = _build_backend()
+
+
+def _too_many(retry_after: float) -> dict:
+    return {"Retry-After": str(max(1, math.ceil(retry_after)))}
+
+
+def throttle(scope: str, key: str) -> None:
+    """
+    Per-account check for use inside handlers. Raises 429 when the bucket is empty.
+    """
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+    retry_after = backend.consume(f"acct:{scope}:{key.lower()}", ACCOUNT_LIMITS[scope])
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many attempts, please try again later",
+            headers=_too_many(retry_after),
+        )
+
+
+def client_ip(scope: dict) -> str:
+    if settings.RATE_LIMIT_TRUST_FORWARDED:
+        for name, value in scope.get("headers", []):
+            if name == b"x-forwarded-for":
+                return value.decode("latin-1").split(",")[0].strip()
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+class RateLimitMiddleware:
+    """
+    Per-IP token bucket for the auth endpoints. Plain ASGI so throttled
+    requests are rejected before routing, body parsing or any DB/hash work.
+    """
+
+    def __init__(self, app, prefix: str = "", limits: Optional[dict[str, RateLimit]] = None):
+        self.app = app
+        self.limits = {prefix + path: limit for path, limit in (limits or IP_LIMITS).items()}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and settings.RATE_LIMIT_ENABLED and scope["method"] == "POST":
+            limit = self.limits.get(scope["path"])
+            if limit is not None:
+                retry_after = await backend.consume_async(f"ip:{scope['path']}:{client_ip(scope)}", limit)
+                if retry_after:
+                    response = JSONResponse(
+                        {"detail": "Too many requests, please try again later"},
+                        status_code=429,
+                        headers=_too_many(retry_after),
+                    )
+                    await response(scope, receive, send)
+                    return
+        await self.app(scope, receive, send)
@@ -1,21 +1,107 @@
+import hashlib
+import hmac
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
 from itsdangerous import URLSafeTimedSerializer, BadSignature, SignatureExpired
 from .config import settings
 
 _serializer = URLSafeTimedSerializer(settings.SECRET_KEY, salt="password-reset")
 
 
-def create_reset_token(email: str) -> str:
-    return _serializer.dumps({"email": email})
+def password_fingerprint(password_hash: str) -> str:
+    """
+    Short keyed digest of the current password hash. It goes into the token,
+    so any token issued before a password change stops matching automatically.
+    """
+    digest = hmac.new(settings.SECRET_KEY.encode(), password_hash.encode(), hashlib.sha256)
+    return digest.hexdigest()[:16]
+
 
+def fingerprint_matches(password_hash: str, fingerprint: str) -> bool:
+    return hmac.compare_digest(password_fingerprint(password_hash), fingerprint)
 
-def verify_reset_token(token: str, max_age_seconds: int) -> str:
+
+class ConsumedTokens:
     """
-    Returns email if token valid, otherwise raises ValueError
+    Bounded set of used reset tokens. Entries expire after `ttl_seconds`
+    (a token older than that is rejected as expired anyway) and the oldest
+    are dropped once `max_size` is reached. Since every entry has the same
+    TTL, insertion order == expiry order, so eviction is O(1) from the front.
+
+    The set lives in one process. Across workers, single use is enforced by
+    the reset itself only updating the row whose hash the token was issued for.
     """
+
+    def __init__(self, ttl_seconds: float, max_size: int = 100_000, clock: Callable[[], float] = time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.clock = clock
+        self._items: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _evict(self, now: float) -> None:
+        while self._items:
+            key, expires = next(iter(self._items.items()))
+            if expires > now and len(self._items) <= self.max_size:
+                break
+            self._items.popitem(last=False)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            self._evict(self.clock())
+            return key in self._items
+
+    def add(self, key: str) -> bool:
+        """
+        Marks key as used. Returns False if it was already used.
+        """
+        with self._lock:
+            now = self.clock()
+            self._evict(now)
+            if key in self._items:
+                return False
+            self._items[key] = now + self.ttl_seconds
+            self._evict(now)
+            return True
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+_consumed = ConsumedTokens(ttl_seconds=int(settings.RESET_TOKEN_EXPIRE_MINUTES) * 60)
+
+
+def _token_key(token: str) -> str:
+    # the signature part is unique per token and already fixed-size
+    return token.rsplit(".", 1)[-1]
+
+
+def create_reset_token(email: str, password_hash: str) -> str:
+    return _serializer.dumps({"email": email, "fp": password_fingerprint(password_hash)})
+
+
+def verify_reset_token(token: str, max_age_seconds: int) -> tuple[str, str]:
+    """
+    Returns (email, password fingerprint) if token valid and unused, otherwise raises ValueError.
+    Does not touch the DB; the caller compares the fingerprint with the user's current hash.
+    """
+    if _token_key(token) in _consumed:
+        raise ValueError("Token already used")
     try:
         data = _serializer.loads(token, max_age=max_age_seconds)
-        return data["email"]
+        return data["email"], data["fp"]
     except SignatureExpired:
         raise ValueError("Token expired")
-    except BadSignature:
+    except (BadSignature, KeyError, TypeError):
         raise ValueError("Invalid token")
+
+
+def consume_reset_token(token: str) -> None:
+    """
+    Claims a verified token. Raises ValueError if another request already used it.
+    """
+    if not _consumed.add(_token_key(token)):
+        raise ValueError("Token already used")
@@ -1,11 +1,18 @@
 from dotenv import load_dotenv
 load_dotenv()
 
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
 from .core.config import settings
 from .core.database import Base, engine
+from .core.events import bus
+from .core.rate_limit import RateLimitMiddleware
 
 # Routers
 from .routers.auth_router import router as auth_router
@@ -17,14 +24,46 @@ from .routers.transactions import router as transactions_router
 from .routers.dashboard import router as dashboard_router
 from .routers.analytics import router as analytics_router
 from .routers.admin_router import router as admin_router
+from .routers.recurring import router as recurring_router, materialize_due
+from .routers.budgets import router as budgets_router
 
 # Models (important for SQLAlchemy)
-from .models import user, goal, transaction
+from .models import user, goal, transaction, investment
 
 # Create DB tables
 Base.metadata.create_all(bind=engine)
 
-app = FastAPI(title=settings.APP_NAME)
+
+logger = logging.getLogger(__name__)
+
+
+async def _recurring_tick():
+    # In-process scheduler: materialize due recurring transactions every tick.
+    # Runs in the threadpool so a big batch doesn't block the event loop, and
+    # a failing tick is logged instead of killing the scheduler.
+    while True:
+        try:
+            await run_in_threadpool(materialize_due)
+        except Exception:
+            logger.exception("Recurring transactions tick failed")
+        await asyncio.sleep(settings.RECURRING_TICK_SECONDS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    tasks = [asyncio.create_task(bus.backend.run())]  # cross-worker event listener (no-op in memory)
+    if settings.RECURRING_TICK_SECONDS > 0:
+        tasks.append(asyncio.create_task(_recurring_tick()))
+    yield
+    for task in tasks:
+        task.cancel()
+
+
+app = FastAPI(title=settings.APP_NAME, lifespan=lifespan)
+
+# ✅ Throttle auth endpoints per IP before any DB lookup or password hashing
+# (added before CORS so 429 responses still carry CORS headers)
+app.add_middleware(RateLimitMiddleware, prefix=settings.API_V1_PREFIX)
 
 # ✅ CORS FIX (MOST IMPORTANT PART)
 app.add_middleware(
@@ -53,3 +92,5 @@ app.include_router(transactions_router, prefix=settings.API_V1_PREFIX)
 app.include_router(dashboard_router, prefix=settings.API_V1_PREFIX)
 app.include_router(analytics_router, prefix=settings.API_V1_PREFIX)
 app.include_router(admin_router, prefix=settings.API_V1_PREFIX)
+app.include_router(recurring_router, prefix=settings.API_V1_PREFIX)
+app.include_router(budgets_router, prefix=settings.API_V1_PREFIX)
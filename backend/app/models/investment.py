@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey
+from datetime import datetime
+from ..core.database import Base
+
+class Investment(Base):
+    __tablename__ = "investments"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+
+    symbol = Column(String(20), nullable=False)
+    asset_type = Column(String(20), nullable=False)   # stock/mutual_fund/etf/gold
+    quantity = Column(Float, nullable=False)
+    avg_price = Column(Float, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
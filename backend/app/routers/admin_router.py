@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.events import publish_change
 
 from app.utils.deps import require_admin
   # ✅ use ONLY this
@@ -62,6 +63,7 @@ def admin_create_goal_for_user(
     db.add(goal)
     db.commit()
     db.refresh(goal)
+    publish_change(goal.user_id)
     return goal
 
 
@@ -85,6 +87,7 @@ def admin_update_goal(
 
     db.commit()
     db.refresh(goal)
+    publish_change(goal.user_id)
     return goal
 
 
@@ -98,6 +101,8 @@ def admin_delete_goal(
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
 
+    owner_id = goal.user_id
     db.delete(goal)
     db.commit()
+    publish_change(owner_id)
     return {"ok": True}
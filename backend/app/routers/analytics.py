@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from datetime import date
 from typing import Dict, Optional
 
 from .transactions import STORE as TX_STORE  # ✅ FIXED import style
+from ..services.analytics_service import MAX_BUCKETS, Interval, bucket_count, net_worth_series
 
 router = APIRouter(prefix="/analytics", tags=["Analytics"])
 
@@ -30,3 +31,29 @@ def spending_by_category(
         bucket[t.category] = bucket.get(t.category, 0) + t.amount
 
     return [{"name": k, "value": v} for k, v in bucket.items()]
+
+
+@router.get("/net-worth")
+def net_worth(
+    from_date: Optional[date] = Query(default=None, alias="from"),
+    to_date: Optional[date] = Query(default=None, alias="to"),
+    interval: Interval = Query(default="day"),
+    max_points: int = Query(default=500, ge=3, le=2000),
+    current_user=Depends(get_current_user),
+):
+    user_id = current_user["id"]
+    txs = TX_STORE.get(user_id, [])
+
+    to_date = to_date or date.today()
+    if from_date is None:
+        # never default past `to`: transactions may all be later than the requested end
+        from_date = min(min((t.tx_date for t in txs), default=to_date), to_date)
+    if from_date > to_date:
+        raise HTTPException(status_code=400, detail="from must be on or before to")
+    if bucket_count(from_date, to_date, interval) > MAX_BUCKETS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Range too large for interval '{interval}' (max {MAX_BUCKETS} points), use a coarser interval",
+        )
+
+    return net_worth_series(txs, from_date, to_date, interval, max_points)
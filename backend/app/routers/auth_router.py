@@ -1,12 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
-from ..core.reset_tokens import create_reset_token, verify_reset_token
+from ..core.reset_tokens import (
+    consume_reset_token,
+    create_reset_token,
+    fingerprint_matches,
+    verify_reset_token,
+)
 from ..core.config import settings
 from ..schemas.user_schema import ForgotPasswordIn, ResetPasswordIn
 from ..core.database import get_db
 from ..core.security import hash_password, verify_password
 from ..core.jwt import create_access_token
+from ..core.rate_limit import throttle
 from ..models.user import User
 from ..schemas.user_schema import RegisterIn, LoginIn, TokenOut
 
@@ -33,6 +39,9 @@ def register(payload: RegisterIn, db: Session = Depends(get_db)):
 
 @router.post("/login", response_model=TokenOut)
 def login(payload: LoginIn, db: Session = Depends(get_db)):
+    # per-account limit first, so credential stuffing never reaches verify_password
+    throttle("login", payload.email)
+
     user = db.query(User).filter(User.email == payload.email).first()
     if not user or not verify_password(payload.password, user.password_hash):
         raise HTTPException(status_code=401, detail="Invalid credentials")
@@ -43,6 +52,8 @@ def login(payload: LoginIn, db: Session = Depends(get_db)):
 # ✅ FIXED: removed extra "/auth"
 @router.post("/forgot-password")
 def forgot_password(payload: ForgotPasswordIn, db: Session = Depends(get_db)):
+    throttle("forgot-password", payload.email)
+
     # 1) check user exists
     user = db.query(User).filter(User.email == payload.email).first()
 
@@ -51,7 +62,7 @@ def forgot_password(payload: ForgotPasswordIn, db: Session = Depends(get_db)):
         return {"ok": True, "message": "If the email exists, a reset link will be sent."}
 
     # 2) create reset token
-    token = create_reset_token(user.email)
+    token = create_reset_token(user.email, user.password_hash)
 
     # 3) build reset link for frontend
     reset_link = f"{settings.FRONTEND_URL}/reset-password?token={token}"
@@ -68,18 +79,36 @@ def forgot_password(payload: ForgotPasswordIn, db: Session = Depends(get_db)):
 # ✅ FIXED: removed extra "/auth"
 @router.post("/reset-password")
 def reset_password(payload: ResetPasswordIn, db: Session = Depends(get_db)):
-    # 1) verify token
+    # 1) verify token (signature, expiry, already used) - no DB access yet
     max_age = int(settings.RESET_TOKEN_EXPIRE_MINUTES) * 60
-    email = verify_reset_token(payload.token, max_age_seconds=max_age)
+    try:
+        email, fingerprint = verify_reset_token(payload.token, max_age_seconds=max_age)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     # 2) find user
     user = db.query(User).filter(User.email == email).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # 3) set new password hash
-    user.password_hash = hash_password(payload.new_password)
-    db.add(user)
+    # 3) token must belong to the current password (invalidated by any later change),
+    #    and only one request may use it - both checked before hashing
+    if not fingerprint_matches(user.password_hash, fingerprint):
+        raise HTTPException(status_code=400, detail="Token is no longer valid")
+    try:
+        consume_reset_token(payload.token)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # 4) set new password hash, only if it is still the one the token was issued for:
+    #    the consumed-token set is per process, this also holds across workers
+    updated = (
+        db.query(User)
+        .filter(User.id == user.id, User.password_hash == user.password_hash)
+        .update({User.password_hash: hash_password(payload.new_password)}, synchronize_session=False)
+    )
     db.commit()
+    if updated != 1:
+        raise HTTPException(status_code=400, detail="Token is no longer valid")
 
     return {"ok": True, "message": "Password updated successfully"}
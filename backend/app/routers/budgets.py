@@ -0,0 +1,61 @@
+# routers/budgets.py
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import date
+
+from ..core.events import publish_change
+from ..services import budget_service
+
+# (Replace with your real auth)
+def get_current_user():
+    return {"id": "user_1", "email": "demo@example.com"}
+
+router = APIRouter(prefix="/budgets", tags=["Budgets"])
+
+
+class BudgetIn(BaseModel):
+    category: str = Field(min_length=1, max_length=50)
+    amount: float = Field(gt=0)  # monthly limit
+
+class BudgetOut(BudgetIn):
+    pass
+
+
+@router.get("", response_model=List[BudgetOut])
+def list_budgets(current_user=Depends(get_current_user)):
+    budgets = budget_service.get_budgets(current_user["id"])
+    return [BudgetOut(category=c, amount=a) for c, a in budgets.items()]
+
+@router.put("", response_model=BudgetOut)
+def set_budget(payload: BudgetIn, current_user=Depends(get_current_user)):
+    budget_service.set_budget(current_user["id"], payload.category, payload.amount)
+    publish_change(current_user["id"])
+    return payload
+
+@router.delete("/{category}")
+def delete_budget(category: str, current_user=Depends(get_current_user)):
+    if not budget_service.delete_budget(current_user["id"], category):
+        raise HTTPException(status_code=404, detail="Budget not found")
+    publish_change(current_user["id"])
+    return {"ok": True}
+
+@router.get("/status")
+def budget_status(
+    month: Optional[int] = None,
+    year: Optional[int] = None,
+    current_user=Depends(get_current_user),
+):
+    today = date.today()
+    month = month or today.month
+    year = year or today.year
+
+    return {
+        "month": month,
+        "year": year,
+        "budgets": budget_service.budget_status(current_user["id"], f"{year:04d}-{month:02d}"),
+    }
+
+@router.get("/alerts")
+def budget_alerts(current_user=Depends(get_current_user)):
+    return budget_service.recent_alerts(current_user["id"])
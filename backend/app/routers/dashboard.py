@@ -1,8 +1,17 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from datetime import date
 from typing import Optional
+import json
 
 from .transactions import STORE as TX_STORE   # ✅ FIXED import style
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..core.events import bus
+from ..core.jwt import decode_token
+from ..models.goal import Goal
+from ..services.budget_service import budget_status, month_key
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
@@ -39,3 +48,96 @@ def dashboard_summary(
         "savings": savings,
         "transactions_count": len(month_txs),
     }
+
+
+def _snapshot(current_user: dict, goal_user_id: Optional[int]) -> dict:
+    """
+    Everything the live dashboard shows, keyed so it can be diffed per entry.
+    """
+    summary = dashboard_summary(month=None, year=None, current_user=current_user)
+
+    budgets = {
+        b["category"]: {k: b[k] for k in ("budget", "spent", "percent", "status")}
+        for b in budget_status(current_user["id"], month_key(date.today()))
+    }
+
+    goals = {}
+    if goal_user_id is not None:
+        db = SessionLocal()
+        try:
+            for g in db.query(Goal).filter(Goal.user_id == goal_user_id).all():
+                goals[str(g.id)] = {
+                    "title": g.title,
+                    "saved_amount": g.saved_amount,
+                    "target_amount": g.target_amount,
+                    "progress": round((g.saved_amount or 0) / g.target_amount * 100, 1) if g.target_amount else 0.0,
+                    "is_completed": g.is_completed,
+                }
+        finally:
+            db.close()
+
+    return {"summary": summary, "goals": goals, "budgets": budgets}
+
+
+def diff_snapshots(old: dict, new: dict) -> dict:
+    """
+    Only the entries that changed, per section. Removed entries are sent as null.
+    """
+    out = {}
+    for section, values in new.items():
+        prev = old.get(section, {})
+        changed = {k: v for k, v in values.items() if prev.get(k) != v}
+        changed.update({k: None for k in prev if k not in values})
+        if changed:
+            out[section] = changed
+    return out
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str, separators=(',', ':'))}\n\n"
+
+
+@router.get("/stream")
+async def dashboard_stream(
+    request: Request,
+    # EventSource cannot send headers, so the JWT (for goals) comes as a query param
+    token: Optional[str] = Query(default=None),
+    current_user=Depends(get_current_user),
+):
+    """
+    Server-sent events: one full `snapshot`, then a `diff` only when this
+    user's transactions, budgets or goals change. Idle connections just
+    wait on the event bus and get a keepalive comment now and then.
+    """
+    keys = {str(current_user["id"])}
+    goal_user_id = None
+    if token:
+        sub = decode_token(token).get("sub")
+        if sub:
+            goal_user_id = int(sub)
+            keys.add(sub)
+
+    async def events():
+        subscription = bus.subscribe(keys)  # before the first snapshot, so no change is missed
+        try:
+            snapshot = await run_in_threadpool(_snapshot, current_user, goal_user_id)
+            yield "retry: 5000\n\n"
+            yield _sse("snapshot", snapshot)
+
+            while not await request.is_disconnected():
+                if not await subscription.wait(settings.EVENTS_KEEPALIVE_SECONDS):
+                    yield ": keepalive\n\n"
+                    continue
+                latest = await run_in_threadpool(_snapshot, current_user, goal_user_id)
+                changes = diff_snapshots(snapshot, latest)
+                snapshot = latest
+                if changes:
+                    yield _sse("diff", changes)
+        finally:
+            bus.unsubscribe(subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from ..core.database import get_db
+from ..core.events import publish_change
 from ..models.goal import Goal
 from ..schemas.goal_schema import GoalIn, GoalOut, GoalUpdate
 from .user_router import current_user
@@ -15,6 +16,7 @@ def create_goal(payload: GoalIn, db: Session = Depends(get_db), user: User = Dep
     db.add(goal)
     db.commit()
     db.refresh(goal)
+    publish_change(goal.user_id)
     return goal
 
 @router.get("", response_model=list[GoalOut])
@@ -35,6 +37,7 @@ def update_goal(goal_id: int, payload: GoalUpdate, db: Session = Depends(get_db)
 
     db.commit()
     db.refresh(goal)
+    publish_change(goal.user_id)
     return goal
 
 @router.delete("/{goal_id}")
@@ -42,6 +45,8 @@ def delete_goal(goal_id: int, db: Session = Depends(get_db), user: User = Depend
     goal = db.query(Goal).filter(Goal.id == goal_id, Goal.user_id == user.id).first()
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
+    owner_id = goal.user_id
     db.delete(goal)
     db.commit()
+    publish_change(owner_id)
     return {"ok": True}
@@ -1,7 +1,22 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from ..models.user import User
+from ..schemas.investment_schema import PriceBarIn
+from ..services.market_service import add_bar
+from ..utils.deps import require_admin
 
 router = APIRouter(prefix="/market", tags=["Market"])
 
 @router.get("/status")
 def market_status():
     return {"ok": True, "market": "stub"}
+
+@router.post("/bars")
+def add_price_bars(
+    bars: list[PriceBarIn],
+    admin: User = Depends(require_admin),  # ✅ only the feed / admins may write prices
+):
+    # daily closes from the price feed; portfolio risk picks them up incrementally
+    for bar in sorted(bars, key=lambda b: b.date):
+        add_bar(bar.symbol, bar.date, bar.close)
+    return {"ok": True, "count": len(bars)}
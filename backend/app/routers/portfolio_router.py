@@ -1,10 +1,30 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from ..core.database import get_db
+from ..models.investment import Investment
+from ..models.user import User
+from ..schemas.investment_schema import HoldingOut
+from ..services.portfolio_service import portfolio_risk
+from .user_router import current_user
 
 router = APIRouter(prefix="/portfolio", tags=["Portfolio"])
 
+
+def _holdings(db: Session, user: User) -> list[Investment]:
+    return db.query(Investment).filter(Investment.user_id == user.id).order_by(Investment.id).all()
+
+
 @router.get("")
-def get_portfolio():
+def get_portfolio(db: Session = Depends(get_db), user: User = Depends(current_user)):
     return {
-        "message": "Portfolio endpoint working",
-        "holdings": []
+        "holdings": [HoldingOut.model_validate(h) for h in _holdings(db, user)],
     }
+
+
+@router.get("/risk")
+def get_portfolio_risk(db: Session = Depends(get_db), user: User = Depends(current_user)):
+    quantities: dict[str, float] = {}
+    for h in _holdings(db, user):
+        quantities[h.symbol] = quantities.get(h.symbol, 0.0) + h.quantity
+    return portfolio_risk(quantities)
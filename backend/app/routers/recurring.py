@@ -0,0 +1,105 @@
+# routers/recurring.py
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, Field
+from typing import Callable, List, Literal, Optional
+from datetime import date, datetime
+import threading
+import uuid
+
+from .transactions import TransactionType, insert_transactions
+from ..services.recurring_service import due_occurrences, is_finished
+
+# (Replace with your real auth)
+def get_current_user():
+    return {"id": "user_1", "email": "demo@example.com"}
+
+router = APIRouter(prefix="/recurring", tags=["Recurring"])
+
+
+Frequency = Literal["daily", "weekly", "monthly", "yearly"]
+
+class RecurringRuleIn(BaseModel):
+    type: TransactionType
+    amount: float = Field(gt=0)
+    category: str = Field(min_length=1, max_length=50)
+    note: Optional[str] = Field(default=None, max_length=200)
+    freq: Frequency = "monthly"
+    interval: int = Field(default=1, ge=1, le=366)  # every N days/weeks/months/years
+    start_date: date
+    until: Optional[date] = None
+
+class RecurringRuleOut(RecurringRuleIn):
+    id: str
+    created_at: datetime
+    next_run: date
+
+# ✅ In-memory store, same shape as transactions.STORE
+# key: user_id -> list[RecurringRuleOut]
+RULES: dict[str, List[RecurringRuleOut]] = {}
+
+# the scheduler tick and rule creation (threadpool) can run at the same time
+_run_lock = threading.Lock()
+
+
+def _materialize(pairs: List[tuple[str, RecurringRuleOut]], today: date) -> int:
+    # caller holds _run_lock
+    batch = due_occurrences(pairs, today)
+    insert_transactions(batch)
+    return len(batch)
+
+
+def materialize_due(clock: Callable[[], date] = date.today) -> int:
+    """
+    Scheduler entry point: materializes due occurrences for ALL users
+    as one batch insert. Returns number of transactions created.
+    """
+    today = clock()
+    # one lock for snapshot + insert: create/delete_rule mutate RULES from the threadpool,
+    # and a rule deleted after the snapshot must not fire once more
+    with _run_lock:
+        pairs = [
+            (user_id, rule)
+            for user_id, rules in RULES.items()
+            for rule in rules
+            if rule.next_run <= today and not is_finished(rule)
+        ]
+        if not pairs:
+            return 0
+        return _materialize(pairs, today)
+
+
+@router.get("", response_model=List[RecurringRuleOut])
+def list_rules(current_user=Depends(get_current_user)):
+    return RULES.get(current_user["id"], [])
+
+@router.post("", response_model=RecurringRuleOut)
+def create_rule(payload: RecurringRuleIn, current_user=Depends(get_current_user)):
+    if payload.until and payload.until < payload.start_date:
+        raise HTTPException(status_code=400, detail="until must be on or after start_date")
+
+    user_id = current_user["id"]
+    rule = RecurringRuleOut(
+        id=str(uuid.uuid4()),
+        created_at=datetime.utcnow(),
+        next_run=payload.start_date,
+        **payload.model_dump(),
+    )
+    with _run_lock:
+        RULES.setdefault(user_id, []).append(rule)
+        # backfill anything already due so the dashboard reflects it immediately
+        _materialize([(user_id, rule)], date.today())
+    return rule
+
+@router.delete("/{rule_id}")
+def delete_rule(rule_id: str, current_user=Depends(get_current_user)):
+    # already materialized transactions are kept; only future occurrences stop
+    user_id = current_user["id"]
+    with _run_lock:
+        items = RULES.get(user_id, [])
+        before = len(items)
+        items = [r for r in items if r.id != rule_id]
+        RULES[user_id] = items
+
+    if len(items) == before:
+        raise HTTPException(status_code=404, detail="Recurring rule not found")
+    return {"ok": True}
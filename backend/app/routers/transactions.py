@@ -5,6 +5,9 @@ from typing import List, Literal, Optional
 from datetime import date, datetime
 import uuid
 
+from ..core.events import publish_change
+from ..services.budget_service import record_transaction
+
 # ✅ Replace this import with your real auth dependency
 # from deps.auth import get_current_user
 def get_current_user():
@@ -31,6 +34,19 @@ class TransactionOut(TransactionIn):
 # key: user_id -> list[TransactionOut]
 STORE: dict[str, List[TransactionOut]] = {}
 
+
+def insert_transactions(rows: List[tuple[str, TransactionOut]]) -> None:
+    """
+    Bulk insert (user_id, tx) pairs in one pass.
+    Used by the recurring scheduler so all users are written as a single batch.
+    """
+    for user_id, tx in rows:
+        STORE.setdefault(user_id, []).append(tx)
+        record_transaction(user_id, tx)
+
+    for user_id in {user_id for user_id, _ in rows}:
+        publish_change(user_id)
+
 @router.get("", response_model=List[TransactionOut])
 def list_transactions(
     type: Optional[TransactionType] = Query(default=None),
@@ -60,17 +76,19 @@ def create_transaction(payload: TransactionIn, current_user=Depends(get_current_
         created_at=datetime.utcnow(),
         **payload.model_dump(),
     )
-    STORE.setdefault(user_id, []).append(tx)
+    insert_transactions([(user_id, tx)])
     return tx
 
 @router.delete("/{tx_id}")
 def delete_transaction(tx_id: str, current_user=Depends(get_current_user)):
     user_id = current_user["id"]
     items = STORE.get(user_id, [])
-    before = len(items)
-    items = [t for t in items if t.id != tx_id]
-    STORE[user_id] = items
+    removed = [t for t in items if t.id == tx_id]
+    STORE[user_id] = [t for t in items if t.id != tx_id]
 
-    if len(items) == before:
+    if not removed:
         raise HTTPException(status_code=404, detail="Transaction not found")
+    for tx in removed:
+        record_transaction(user_id, tx, sign=-1)
+    publish_change(user_id)
     return {"ok": True}
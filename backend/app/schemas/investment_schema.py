@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+from datetime import date, datetime
+
+class HoldingOut(BaseModel):
+    id: int
+    symbol: str
+    asset_type: str
+    quantity: float
+    avg_price: float
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class PriceBarIn(BaseModel):
+    symbol: str = Field(min_length=1, max_length=20)
+    date: date
+    close: float = Field(gt=0)
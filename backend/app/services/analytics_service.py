@@ -0,0 +1,126 @@
+from datetime import date, timedelta
+from typing import Iterable, List, Literal
+
+import numpy as np
+
+Interval = Literal["day", "week", "month"]
+
+# How each transaction type moves net worth
+NET_WORTH_SIGN = {"income": 1.0, "expense": -1.0, "investment": 1.0}
+
+# Upper bound on buckets per request (~55 years of days); the router rejects larger ranges
+MAX_BUCKETS = 20_000
+
+
+def _bucket_start(d: date, interval: Interval) -> date:
+    if interval == "week":
+        return d - timedelta(days=d.weekday())  # Monday
+    if interval == "month":
+        return d.replace(day=1)
+    return d
+
+
+def _bucket_edges(start: date, end: date, interval: Interval) -> np.ndarray:
+    """
+    Start date of every bucket between start and end (inclusive) as datetime64[D].
+    """
+    first = _bucket_start(start, interval)
+    # numpy dates go past date.max, so end + 1 day can't overflow
+    stop = np.datetime64(end, "D") + 1
+    if interval == "day":
+        return np.arange(first, stop, dtype="datetime64[D]")
+    if interval == "week":
+        return np.arange(first, stop, 7, dtype="datetime64[D]")
+    months = np.arange(
+        np.datetime64(first, "M"),
+        np.datetime64(end, "M") + 1,
+        dtype="datetime64[M]",
+    )
+    return months.astype("datetime64[D]")
+
+
+def bucket_count(start: date, end: date, interval: Interval) -> int:
+    """
+    Number of buckets _bucket_edges would build, without allocating them.
+    """
+    if interval == "month":
+        return (end.year - start.year) * 12 + end.month - start.month + 1
+    first = _bucket_start(start, interval)
+    step = 7 if interval == "week" else 1
+    return (end - first).days // step + 1
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+    Returns indices of the points to keep (always includes first and last).
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+
+    # n_out - 2 buckets over the inner points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i < n_out - 3:
+            nxt = slice(edges[i + 1], edges[i + 2])
+            avg_x, avg_y = x[nxt].mean(), y[nxt].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+def net_worth_series(
+    txs: Iterable,
+    from_date: date,
+    to_date: date,
+    interval: Interval = "day",
+    max_points: int = 500,
+) -> dict:
+    """
+    Cumulative net worth (income - expense + investments) at the end of each
+    bucket between from_date and to_date. Everything before from_date is
+    folded into the opening balance. Long series are downsampled with LTTB.
+    """
+    txs = list(txs)
+    dates = np.array([t.tx_date for t in txs], dtype="datetime64[D]")
+    signed = np.array(
+        [NET_WORTH_SIGN.get(t.type, 0.0) * t.amount for t in txs],
+        dtype=np.float64,
+    )
+
+    lo, hi = np.datetime64(from_date, "D"), np.datetime64(to_date, "D")
+    opening = float(signed[dates < lo].sum())
+
+    edges = _bucket_edges(from_date, to_date, interval)
+    in_range = (dates >= lo) & (dates <= hi)
+    bucket = np.searchsorted(edges, dates[in_range], side="right") - 1
+    deltas = np.bincount(bucket, weights=signed[in_range], minlength=len(edges))
+    values = opening + np.cumsum(deltas)
+
+    keep = lttb(edges.astype(np.int64).astype(np.float64), values, max_points)
+
+    points: List[dict] = [
+        {"date": str(d), "value": round(float(v), 2)}
+        for d, v in zip(edges[keep], values[keep])
+    ]
+    return {
+        "from": from_date,
+        "to": to_date,
+        "interval": interval,
+        "opening_balance": round(opening, 2),
+        "downsampled": len(keep) < len(edges),
+        "points": points,
+    }
@@ -0,0 +1,110 @@
+from collections import deque
+from datetime import date, datetime
+import threading
+from typing import Deque, Optional
+
+# Fire an alert when spend crosses these fractions of the budget
+ALERT_THRESHOLDS = (0.8, 1.0)
+MAX_ALERTS_PER_USER = 100
+
+# ✅ In-memory, same as transactions.STORE
+# user_id -> {category: monthly limit}
+BUDGETS: dict[str, dict[str, float]] = {}
+# (user_id, "YYYY-MM") -> {category: running expense total}
+SPEND: dict[tuple[str, str], dict[str, float]] = {}
+# user_id -> most recent alerts (oldest dropped first)
+ALERTS: dict[str, Deque[dict]] = {}
+
+_lock = threading.Lock()
+
+
+def month_key(d: date) -> str:
+    return f"{d.year:04d}-{d.month:02d}"
+
+
+def _fire(user_id: str, month: str, category: str, spent: float, limit: float,
+          before_ratio: float, after_ratio: float) -> None:
+    for threshold in ALERT_THRESHOLDS:
+        if before_ratio < threshold <= after_ratio:
+            ALERTS.setdefault(user_id, deque(maxlen=MAX_ALERTS_PER_USER)).append({
+                "month": month,
+                "category": category,
+                "threshold": int(threshold * 100),
+                "spent": round(spent, 2),
+                "budget": limit,
+                "created_at": datetime.utcnow(),
+            })
+
+
+def record_transaction(user_id: str, tx, sign: int = 1) -> None:
+    """
+    O(1) update of the running spend for (user, month, category).
+    sign=1 on create, -1 on delete. Fires threshold alerts on the way up.
+    """
+    if tx.type != "expense":
+        return
+    month = month_key(tx.tx_date)
+    with _lock:
+        by_category = SPEND.setdefault((user_id, month), {})
+        before = by_category.get(tx.category, 0.0)
+        after = before + sign * tx.amount
+        by_category[tx.category] = after
+
+        limit = BUDGETS.get(user_id, {}).get(tx.category)
+        if limit:
+            _fire(user_id, month, tx.category, after, limit, before / limit, after / limit)
+
+
+def set_budget(user_id: str, category: str, amount: float, today: Optional[date] = None) -> None:
+    """
+    Creates/updates a monthly budget. Lowering it below what was already spent
+    this month fires the alerts right away.
+    """
+    month = month_key(today or date.today())
+    with _lock:
+        budgets = BUDGETS.setdefault(user_id, {})
+        old = budgets.get(category)
+        budgets[category] = amount
+
+        spent = SPEND.get((user_id, month), {}).get(category, 0.0)
+        before_ratio = spent / old if old else 0.0
+        _fire(user_id, month, category, spent, amount, before_ratio, spent / amount)
+
+
+def delete_budget(user_id: str, category: str) -> bool:
+    with _lock:
+        return BUDGETS.get(user_id, {}).pop(category, None) is not None
+
+
+def get_budgets(user_id: str) -> dict[str, float]:
+    # copy under the lock: set_budget may add categories from another threadpool worker
+    with _lock:
+        return dict(BUDGETS.get(user_id, {}))
+
+
+def budget_status(user_id: str, month: str) -> list[dict]:
+    """
+    Spend vs budget per category for one month, read straight from the running totals.
+    """
+    with _lock:
+        budgets = dict(BUDGETS.get(user_id, {}))
+        spent_by_category = dict(SPEND.get((user_id, month), {}))
+
+    items = []
+    for category, limit in budgets.items():
+        spent = round(spent_by_category.get(category, 0.0), 2)
+        ratio = spent / limit
+        items.append({
+            "category": category,
+            "budget": limit,
+            "spent": spent,
+            "remaining": round(limit - spent, 2),
+            "percent": round(ratio * 100, 1),
+            "status": "over" if ratio >= 1 else "warning" if ratio >= ALERT_THRESHOLDS[0] else "ok",
+        })
+    return items
+
+
+def recent_alerts(user_id: str) -> list[dict]:
+    with _lock:
+        return list(reversed(ALERTS.get(user_id, ())))
@@ -0,0 +1,87 @@
+from bisect import bisect_left, bisect_right
+from datetime import date
+import threading
+from typing import Iterable, Optional
+
+import numpy as np
+
+# ✅ In-memory daily close prices (swap with a real feed / table later)
+# symbol -> (dates, closes), both kept sorted by date
+PRICES: dict[str, tuple[list[date], list[float]]] = {}
+
+# symbol -> revision, bumped whenever that symbol's already-seen history is
+# rewritten (late or corrected bars). Anything derived incrementally from the
+# old history of that symbol must be rebuilt.
+REVISIONS: dict[str, int] = {}
+
+_lock = threading.Lock()
+
+
+def add_bar(symbol: str, day: date, close: float) -> None:
+    with _lock:
+        dates, closes = PRICES.setdefault(symbol, ([], []))
+        if not dates or day > dates[-1]:
+            dates.append(day)
+            closes.append(close)
+            return
+
+        # out of order / correction: keep sorted and invalidate derived state
+        i = bisect_left(dates, day)
+        if i < len(dates) and dates[i] == day:
+            closes[i] = close
+        else:
+            dates.insert(i, day)
+            closes.insert(i, close)
+        REVISIONS[symbol] = REVISIONS.get(symbol, 0) + 1
+
+
+def history_revision(symbols: Iterable[str]) -> tuple[int, ...]:
+    """
+    Revisions of just these symbols: changes only if one of their histories was rewritten.
+    """
+    return tuple(REVISIONS.get(s, 0) for s in symbols)
+
+
+def last_common_date(symbols: Iterable[str]) -> Optional[date]:
+    """
+    Latest date every symbol has a close for (rows up to here are final).
+    """
+    last = [PRICES[s][0][-1] for s in symbols if s in PRICES and PRICES[s][0]]
+    return min(last) if last else None
+
+
+def price_matrix(symbols: list[str], after: Optional[date] = None, until: Optional[date] = None):
+    """
+    Aligned close prices as a (dates x symbols) matrix, forward-filled over
+    gaps (holidays differ per exchange). Only rows where every symbol has a
+    price, after `after` and up to `until`, are returned - so reading just
+    the newest bars only touches the tail of each series.
+    Returns (dates as datetime64[D], matrix).
+    """
+    series = []
+    with _lock:
+        for s in symbols:
+            dates, closes = PRICES.get(s, ([], []))
+            # keep one bar before `after` so the first new row can be forward-filled
+            start = max(bisect_right(dates, after) - 1, 0) if after else 0
+            end = bisect_right(dates, until) if until else len(dates)
+            series.append((
+                np.array(dates[start:end], dtype="datetime64[D]"),
+                np.array(closes[start:end], dtype=np.float64),
+            ))
+
+    if not series:
+        return np.array([], dtype="datetime64[D]"), np.empty((0, 0))
+
+    index = np.unique(np.concatenate([d for d, _ in series]))
+    if after is not None:
+        index = index[index > np.datetime64(after, "D")]
+
+    matrix = np.full((len(index), len(series)), np.nan)
+    for j, (d, c) in enumerate(series):
+        pos = np.searchsorted(d, index, side="right") - 1
+        has = pos >= 0
+        matrix[has, j] = c[pos[has]]
+
+    complete = ~np.isnan(matrix).any(axis=1)
+    return index[complete], matrix[complete]
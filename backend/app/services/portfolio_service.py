@@ -0,0 +1,186 @@
+from collections import OrderedDict
+import copy
+from datetime import date
+import hashlib
+import threading
+from typing import Optional
+
+import numpy as np
+
+from ..core.config import settings
+from . import market_service
+
+TRADING_DAYS = 252
+MAX_CACHED_PORTFOLIOS = 1024
+
+
+def portfolio_version(holdings: dict[str, float]) -> str:
+    """
+    Changes whenever the set of symbols or any quantity changes.
+    """
+    raw = ";".join(f"{symbol}:{qty:.6f}" for symbol, qty in sorted(holdings.items()))
+    return hashlib.sha1(raw.encode()).hexdigest()[:12]
+
+
+class RiskState:
+    """
+    Running statistics for one portfolio version over its daily price matrix.
+
+    Keeps sums of returns / outer products and running peaks instead of the
+    raw history, so a new daily bar is an O(N^2) update (N = holdings) and
+    never a re-scan. A full build is the same update over all rows at once.
+    """
+
+    def __init__(self, symbols: list[str], quantities: np.ndarray, revision: tuple[int, ...]):
+        n = len(symbols)
+        self.symbols = symbols
+        self.quantities = quantities
+        self.revision = revision
+        self.lock = threading.Lock()
+
+        self.price_date: Optional[date] = None
+        self.observations = 0                      # number of daily returns
+        self.sum_returns = np.zeros(n)
+        self.sum_outer = np.zeros((n, n))
+        self.sum_portfolio = 0.0
+        self.sum_portfolio_sq = 0.0
+
+        self.last_prices: Optional[np.ndarray] = None
+        self.peak_prices: Optional[np.ndarray] = None
+        self.asset_drawdown = np.zeros(n)
+        self.peak_value = 0.0
+        self.max_drawdown = 0.0
+
+        self._metrics: Optional[dict] = None
+
+    def update(self, dates: np.ndarray, prices: np.ndarray) -> None:
+        """
+        Folds new rows (dates x symbols, oldest first) into the statistics.
+        """
+        if len(dates) == 0:
+            return
+        block = prices if self.last_prices is None else np.vstack([self.last_prices, prices])
+
+        returns = block[1:] / block[:-1] - 1
+        self.observations += len(returns)
+        self.sum_returns += returns.sum(axis=0)
+        self.sum_outer += returns.T @ returns
+
+        # buy-and-hold value of the actual quantities
+        values = block @ self.quantities
+        portfolio_returns = values[1:] / values[:-1] - 1
+        self.sum_portfolio += portfolio_returns.sum()
+        self.sum_portfolio_sq += portfolio_returns @ portfolio_returns
+
+        peaks = np.maximum.accumulate(block, axis=0)
+        value_peaks = np.maximum.accumulate(values)
+        if self.peak_prices is not None:
+            peaks = np.maximum(peaks, self.peak_prices)
+            value_peaks = np.maximum(value_peaks, self.peak_value)
+        self.asset_drawdown = np.minimum(self.asset_drawdown, (block / peaks - 1).min(axis=0))
+        self.max_drawdown = min(self.max_drawdown, float((values / value_peaks - 1).min()))
+
+        self.peak_prices = peaks[-1]
+        self.peak_value = float(value_peaks[-1])
+        self.last_prices = block[-1]
+        self.price_date = dates[-1].item()
+        self._metrics = None
+
+    def metrics(self) -> dict:
+        # computed once per price date; callers get a copy they are free to modify
+        if self._metrics is None:
+            self._metrics = self._compute()
+        return copy.deepcopy(self._metrics)
+
+    def _compute(self) -> dict:
+        n = self.observations
+        out = {
+            "as_of": self.price_date,
+            "observations": n,
+            "portfolio": {"annual_return": None, "volatility": None, "sharpe": None,
+                          "max_drawdown": round(self.max_drawdown, 6)},
+            "assets": {},
+            "covariance": None,
+            "correlation": None,
+        }
+        if self.last_prices is None:
+            return out
+
+        market_values = self.quantities * self.last_prices
+        weights = market_values / market_values.sum()
+        out["portfolio"]["market_value"] = round(float(market_values.sum()), 2)
+
+        vols = np.full(len(self.symbols), np.nan)
+        if n >= 2:
+            mean = self.sum_returns / n
+            cov = (self.sum_outer - n * np.outer(mean, mean)) / (n - 1) * TRADING_DAYS
+            vols = np.sqrt(np.clip(np.diag(cov), 0, None))
+            denom = np.outer(vols, vols)
+            corr = np.divide(cov, denom, out=np.zeros_like(cov), where=denom > 0)
+            np.fill_diagonal(corr, 1.0)
+
+            p_mean = self.sum_portfolio / n
+            p_var = max((self.sum_portfolio_sq - n * p_mean ** 2) / (n - 1), 0.0)
+            p_vol = float(np.sqrt(p_var * TRADING_DAYS))
+            annual_return = float(p_mean * TRADING_DAYS)
+
+            out["portfolio"].update({
+                "annual_return": round(annual_return, 6),
+                "volatility": round(p_vol, 6),
+                "sharpe": round((annual_return - settings.RISK_FREE_RATE) / p_vol, 4) if p_vol > 0 else None,
+            })
+            out["covariance"] = np.round(cov, 8).tolist()
+            out["correlation"] = np.round(corr, 4).tolist()
+
+        for i, symbol in enumerate(self.symbols):
+            out["assets"][symbol] = {
+                "weight": round(float(weights[i]), 6),
+                "volatility": None if np.isnan(vols[i]) else round(float(vols[i]), 6),
+                "max_drawdown": round(float(self.asset_drawdown[i]), 6),
+            }
+        return out
+
+
+# portfolio version -> RiskState (least recently used dropped first)
+_cache: "OrderedDict[str, RiskState]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _state_for(version: str, symbols: list[str], quantities: np.ndarray) -> RiskState:
+    revision = market_service.history_revision(symbols)
+    with _cache_lock:
+        state = _cache.get(version)
+        if state is None or state.revision != revision:
+            state = RiskState(symbols, quantities, revision)
+            _cache[version] = state
+        _cache.move_to_end(version)
+        while len(_cache) > MAX_CACHED_PORTFOLIOS:
+            _cache.popitem(last=False)
+    return state
+
+
+def portfolio_risk(holdings: dict[str, float]) -> dict:
+    """
+    Volatility, max drawdown, Sharpe and covariance/correlation for the
+    given {symbol: quantity}. Cached per (portfolio version, price date);
+    when newer bars exist only those rows are folded in.
+    """
+    priced = {s: q for s, q in holdings.items() if q > 0 and s in market_service.PRICES}
+    symbols = sorted(priced)
+    version = portfolio_version(priced)
+
+    state = _state_for(version, symbols, np.array([priced[s] for s in symbols], dtype=np.float64))
+    as_of = market_service.last_common_date(symbols)
+
+    with state.lock:
+        if as_of is not None and state.price_date != as_of:
+            dates, prices = market_service.price_matrix(symbols, after=state.price_date, until=as_of)
+            state.update(dates, prices)
+        result = state.metrics()
+
+    return {
+        "portfolio_version": version,
+        "symbols": symbols,
+        "missing_prices": sorted(s for s in holdings if s not in market_service.PRICES),
+        **result,
+    }
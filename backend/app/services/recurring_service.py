@@ -0,0 +1,74 @@
+from calendar import monthrange
+from datetime import date, datetime, timedelta
+from typing import Iterable, List
+import uuid
+
+from ..routers.transactions import TransactionOut
+
+# How far a single rule may catch up in one run (e.g. a daily rule created
+# with a start_date years in the past). Anything beyond is picked up next tick.
+MAX_OCCURRENCES_PER_RULE = 1000
+
+
+def _add_months(d: date, months: int, anchor_day: int) -> date:
+    month_index = d.month - 1 + months
+    year = d.year + month_index // 12
+    month = month_index % 12 + 1
+    # clamp 29/30/31 to the last day of shorter months, keep the original day afterwards
+    day = min(anchor_day, monthrange(year, month)[1])
+    return date(year, month, day)
+
+
+def next_occurrence(rule, current: date) -> date:
+    """
+    Returns the occurrence after `current` for an RRULE-like rule
+    (freq: daily/weekly/monthly/yearly, every `interval` periods).
+    """
+    if rule.freq == "daily":
+        return current + timedelta(days=rule.interval)
+    if rule.freq == "weekly":
+        return current + timedelta(weeks=rule.interval)
+    if rule.freq == "monthly":
+        return _add_months(current, rule.interval, rule.start_date.day)
+    if rule.freq == "yearly":
+        return _add_months(current, 12 * rule.interval, rule.start_date.day)
+    raise ValueError(f"Unsupported frequency: {rule.freq}")
+
+
+def is_finished(rule) -> bool:
+    """
+    True once the rule has moved past its `until` date and will never fire again.
+    """
+    return bool(rule.until) and rule.next_run > rule.until
+
+
+def due_occurrences(rules: Iterable[tuple[str, object]], today: date) -> List[tuple[str, TransactionOut]]:
+    """
+    Collects every occurrence due on or before `today` across all given
+    (user_id, rule) pairs and advances each rule's `next_run`.
+    Returns the rows so the caller can insert them as one batch.
+    """
+    now = datetime.utcnow()
+    batch: List[tuple[str, TransactionOut]] = []
+
+    for user_id, rule in rules:
+        emitted = 0
+        while rule.next_run <= today and emitted < MAX_OCCURRENCES_PER_RULE:
+            if is_finished(rule):
+                break
+            batch.append((
+                user_id,
+                TransactionOut(
+                    id=str(uuid.uuid4()),
+                    created_at=now,
+                    type=rule.type,
+                    amount=rule.amount,
+                    category=rule.category,
+                    tx_date=rule.next_run,
+                    note=rule.note,
+                ),
+            ))
+            rule.next_run = next_occurrence(rule, rule.next_run)
+            emitted += 1
+
+    return batch
@@ -0,0 +1,128 @@
+# benchmarks/common.py
+# Shared helpers for the benchmark suite. Import this BEFORE any app module:
+# it points the app at a throwaway SQLite DB and turns off background/throttling
+# features that would distort the numbers.
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, List
+
+os.environ.setdefault(
+    "DATABASE_URL",
+    "sqlite:///" + os.path.join(tempfile.gettempdir(), "wealth_bench.db"),
+)
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("RECURRING_TICK_SECONDS", "0")
+
+CATEGORIES = {
+    "income": ["Salary", "Freelance", "Dividends"],
+    "expense": ["Rent", "Groceries", "Transport", "Dining", "Utilities", "Shopping", "Health"],
+    "investment": ["SIP", "Stocks", "Gold"],
+}
+TYPE_WEIGHTS = {"income": 0.1, "expense": 0.8, "investment": 0.1}
+
+
+def synthetic_transactions(n: int, seed: int = 42, start: date = date(2020, 1, 1)) -> List:
+    """
+    n TransactionOut rows spread over the years after `start`, deterministic per seed.
+    """
+    from app.routers.transactions import TransactionOut
+
+    rng = random.Random(seed)
+    types = list(TYPE_WEIGHTS)
+    weights = list(TYPE_WEIGHTS.values())
+    span_days = max(365, n // 5)
+    created = datetime(2024, 1, 1)
+
+    rows = []
+    for i in range(n):
+        t = rng.choices(types, weights)[0]
+        rows.append(TransactionOut(
+            id=f"bench-{i}",
+            created_at=created,
+            type=t,
+            amount=round(rng.lognormvariate(6, 1), 2),
+            category=rng.choice(CATEGORIES[t]),
+            tx_date=start + timedelta(days=rng.randrange(span_days)),
+        ))
+    return rows
+
+
+def time_call(fn: Callable[[], object], repeat: int = 5, min_time: float = 0.2) -> dict:
+    """
+    Calls fn in batches until each batch takes >= min_time, `repeat` times.
+    Reports seconds per call (best + median of batches).
+    """
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2
+
+    per_call = [elapsed / number]
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        per_call.append((time.perf_counter() - t0) / number)
+
+    return {
+        "calls_per_batch": number,
+        "best_s": min(per_call),
+        "median_s": statistics.median(per_call),
+    }
+
+
+def percentiles(samples: List[float]) -> dict:
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+
+    def pct(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+    return {
+        "count": len(ordered),
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "p50_ms": pct(0.50) * 1000,
+        "p95_ms": pct(0.95) * 1000,
+        "p99_ms": pct(0.99) * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL, text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def write_results(path: str, suite: str, results: dict, params: dict) -> dict:
+    payload = {
+        "suite": suite,
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "params": params,
+        },
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2, default=str)
+    return payload
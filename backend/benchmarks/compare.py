@@ -0,0 +1,59 @@
+# benchmarks/compare.py
+# Compare two result files from the same suite (e.g. main vs. your branch).
+#
+#   python -m benchmarks.compare old.json new.json --threshold 1.2
+# Exits with status 1 if any metric got slower than `threshold` x baseline.
+import argparse
+import json
+import sys
+
+
+def _metrics(payload: dict) -> dict[str, float]:
+    """
+    Flatten results to {name: seconds-or-ms}, lower is better.
+    """
+    results = payload["results"]
+    if payload["suite"] == "micro":
+        return {name: r["median_s"] for name, r in results.items()}
+
+    out = {"total.p50_ms": results["total"]["p50_ms"], "total.p95_ms": results["total"]["p95_ms"]}
+    for op, r in results["per_endpoint"].items():
+        if r.get("count"):
+            out[f"{op}.p50_ms"] = r["p50_ms"]
+            out[f"{op}.p95_ms"] = r["p95_ms"]
+    return out
+
+
+def compare(old: dict, new: dict, threshold: float) -> list[str]:
+    if old["suite"] != new["suite"]:
+        raise SystemExit(f"Cannot compare suite {old['suite']!r} with {new['suite']!r}")
+
+    before, after = _metrics(old), _metrics(new)
+    regressions = []
+    print(f"{'metric':45s} {old['meta']['commit']:>12s} {new['meta']['commit']:>12s}  ratio")
+    for name in sorted(before.keys() & after.keys()):
+        ratio = after[name] / before[name] if before[name] else float("inf")
+        flag = "  <-- slower" if ratio > threshold else ""
+        print(f"{name:45s} {before[name]:12.6g} {after[name]:12.6g}  {ratio:5.2f}x{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=1.2)
+    args = parser.parse_args(argv)
+
+    with open(args.baseline) as f:
+        old = json.load(f)
+    with open(args.candidate) as f:
+        new = json.load(f)
+
+    return 1 if compare(old, new, args.threshold) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+# benchmarks/load.py
+# In-process load generator: drives the ASGI app through httpx.AsyncClient
+# (no network, no uvicorn) with a read/write mix. By default the tables are
+# dropped and recreated (SQLite only); --keep-data runs against an existing,
+# e.g. seeded, database and logs in as its seed users instead.
+# Only the users / goals / auth endpoints touch that database; the transaction,
+# dashboard, analytics and budget endpoints read the in-memory STORE, which
+# holds just what this run created - seeded transactions are never read.
+#
+#   cd backend
+#   python -m benchmarks.load --users 20 --concurrency 20 --requests 5000 --out bench_load.json
+#   python -m benchmarks.seed --users 10000 && python -m benchmarks.load --keep-data
+import argparse
+import asyncio
+import os
+import random
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+
+# common must be imported before app modules (sets DATABASE_URL etc.)
+from .common import CATEGORIES, percentiles, write_results
+
+import httpx
+from sqlalchemy import create_engine
+
+from app.core.config import settings
+from app.core.database import Base, SessionLocal, engine as default_engine
+from app.main import app
+from app.models.user import User
+
+from .seed import SEED_PASSWORD
+
+API = settings.API_V1_PREFIX
+
+# (name, weight) - roughly what the dashboard does per session: mostly reads
+MIX = [
+    ("dashboard_summary", 25),
+    ("budget_status", 5),
+    ("list_transactions", 15),
+    ("spending_by_category", 10),
+    ("net_worth", 5),
+    ("list_goals", 15),
+    ("create_transaction", 15),
+    ("create_goal", 5),
+    ("me", 4),
+    ("login", 1),
+]
+
+
+def _random_tx(rng: random.Random) -> dict:
+    t = rng.choices(["income", "expense", "investment"], [1, 8, 1])[0]
+    return {
+        "type": t,
+        "amount": round(rng.lognormvariate(6, 1), 2),
+        "category": rng.choice(CATEGORIES[t]),
+        "tx_date": (date.today() - timedelta(days=rng.randrange(365))).isoformat(),
+    }
+
+
+async def _call(client: httpx.AsyncClient, op: str, user: dict, rng: random.Random) -> httpx.Response:
+    auth = {"Authorization": f"Bearer {user['token']}"}
+    if op == "dashboard_summary":
+        return await client.get(f"{API}/dashboard/summary")
+    if op == "budget_status":
+        return await client.get(f"{API}/budgets/status")
+    if op == "list_transactions":
+        return await client.get(f"{API}/transactions", params={"type": "expense"})
+    if op == "spending_by_category":
+        return await client.get(f"{API}/analytics/spending-by-category")
+    if op == "net_worth":
+        return await client.get(f"{API}/analytics/net-worth", params={"interval": "week"})
+    if op == "list_goals":
+        return await client.get(f"{API}/goals", headers=auth)
+    if op == "create_transaction":
+        return await client.post(f"{API}/transactions", json=_random_tx(rng))
+    if op == "create_goal":
+        goal = {"title": "Emergency fund", "target_amount": rng.randint(1, 100) * 1000}
+        return await client.post(f"{API}/goals", json=goal, headers=auth)
+    if op == "me":
+        return await client.get(f"{API}/users/me", headers=auth)
+    if op == "login":
+        return await client.post(f"{API}/auth/login", json={"email": user["email"], "password": user["password"]})
+    raise ValueError(op)
+
+
+async def _seed_users(client: httpx.AsyncClient, n: int) -> list[dict]:
+    """
+    Logs in as up to n users created by benchmarks.seed.
+    """
+    db = SessionLocal()
+    try:
+        emails = [
+            email for (email,) in db.query(User.email)
+            .filter(User.email.like("%@seed.example.com"))
+            .order_by(User.id)
+            .limit(n)
+        ]
+    finally:
+        db.close()
+
+    users = []
+    for email in emails:
+        user = {"email": email, "password": SEED_PASSWORD}
+        res = await client.post(f"{API}/auth/login", json=user)
+        res.raise_for_status()
+        user["token"] = res.json()["access_token"]
+        users.append(user)
+    return users
+
+
+async def _setup_users(client: httpx.AsyncClient, n: int, run_id: str) -> list[dict]:
+    users = []
+    for i in range(n):
+        user = {"email": f"load{run_id}_{i}@example.com", "password": "loadtest-pass"}
+        res = await client.post(
+            f"{API}/auth/register",
+            json={"name": f"Load User {i}", **user},
+        )
+        res.raise_for_status()
+        user["token"] = res.json()["access_token"]
+        users.append(user)
+    return users
+
+
+async def run(users: int, concurrency: int, total: int, seed: int, engine=default_engine, keep_data: bool = False) -> dict:
+    SessionLocal.configure(bind=engine)
+    if keep_data:
+        Base.metadata.create_all(bind=engine)
+    else:
+        # tables are dropped between runs, never point this at a real database
+        if engine.url.get_backend_name() != "sqlite":
+            raise SystemExit(
+                f"Refusing to drop tables on {engine.url.get_backend_name()}; use SQLite or --keep-data"
+            )
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        accounts = await _seed_users(client, users) if keep_data else []
+        if len(accounts) < users:
+            accounts += await _setup_users(client, users - len(accounts), run_id=str(os.getpid()))
+
+        ops, weights = zip(*MIX)
+        latencies: dict[str, list[float]] = defaultdict(list)
+        errors: dict[str, int] = defaultdict(int)
+        remaining = total
+
+        async def worker(wid: int):
+            nonlocal remaining
+            rng = random.Random(seed + wid)
+            while remaining > 0:
+                remaining -= 1
+                op = rng.choices(ops, weights)[0]
+                user = rng.choice(accounts)
+                t0 = time.perf_counter()
+                res = await _call(client, op, user, rng)
+                latencies[op].append(time.perf_counter() - t0)
+                if res.status_code >= 400:
+                    errors[op] += 1
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(worker(w) for w in range(concurrency)))
+        wall = time.perf_counter() - t0
+
+    per_op = {op: {**percentiles(latencies[op]), "errors": errors[op]} for op in ops}
+    all_samples = [s for samples in latencies.values() for s in samples]
+    return {
+        "total": {
+            **percentiles(all_samples),
+            "errors": sum(errors.values()),
+            "wall_s": wall,
+            "rps": len(all_samples) / wall if wall else 0.0,
+        },
+        "per_endpoint": per_op,
+    }
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description="In-process API load generator")
+    parser.add_argument("--out", default="bench_load.json")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--database-url", default=None, help="defaults to DATABASE_URL")
+    parser.add_argument("--keep-data", action="store_true",
+                        help="don't drop tables; reuse seeded users (see benchmarks.seed)")
+    args = parser.parse_args(argv)
+
+    engine = create_engine(args.database_url) if args.database_url else default_engine
+    print(f"Load test against {engine.url.render_as_string(hide_password=True)}"
+          f"{' (keeping data)' if args.keep_data else ''}")
+    results = asyncio.run(run(args.users, args.concurrency, args.requests, args.seed, engine, args.keep_data))
+
+    total = results["total"]
+    print(f"{total['count']} requests in {total['wall_s']:.2f}s -> {total['rps']:.0f} req/s, "
+          f"p50 {total['p50_ms']:.1f} ms, p99 {total['p99_ms']:.1f} ms, errors {total['errors']}")
+    for op, r in results["per_endpoint"].items():
+        if r["count"]:
+            print(f"  {op:22s} n={r['count']:6d}  p50 {r['p50_ms']:8.2f} ms  p95 {r['p95_ms']:8.2f} ms  errors {r['errors']}")
+
+    write_results(args.out, "load", results, vars(args))
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# benchmarks/micro.py
+# Micro-benchmarks for the hot functions.
+#
+#   cd backend
+#   python -m benchmarks.micro --out bench_micro.json
+#   python -m benchmarks.micro --sizes 1000 10000 --quick
+import argparse
+
+# common must be imported before app modules (sets DATABASE_URL etc.)
+from .common import synthetic_transactions, time_call, write_results
+
+from app.core.jwt import create_access_token, decode_token
+from app.core.reset_tokens import create_reset_token, fingerprint_matches, verify_reset_token
+from app.core.security import hash_password, verify_password
+from app.routers import transactions
+from app.routers.analytics import spending_by_category
+from app.routers.dashboard import dashboard_summary
+
+BENCH_USER = {"id": "bench_user", "email": "bench@example.com"}
+
+
+def bench_auth(repeat: int, min_time: float) -> dict:
+    token = create_access_token("123")
+    hashed = hash_password("correct horse battery staple")
+    reset_token = create_reset_token("bench@example.com", hashed)
+
+    def verify_reset():
+        # everything reset_password does before hashing the new password (minus the user lookup)
+        _, fp = verify_reset_token(reset_token, max_age_seconds=1800)
+        fingerprint_matches(hashed, fp)
+
+    return {
+        "hash_password": time_call(lambda: hash_password("correct horse battery staple"), repeat, min_time),
+        "verify_password": time_call(lambda: verify_password("correct horse battery staple", hashed), repeat, min_time),
+        "decode_token": time_call(lambda: decode_token(token), repeat, min_time),
+        "create_reset_token": time_call(lambda: create_reset_token("bench@example.com", hashed), repeat, min_time),
+        "verify_reset_token": time_call(verify_reset, repeat, min_time),
+    }
+
+
+def bench_rollups(sizes: list[int], seed: int, repeat: int, min_time: float) -> dict:
+    results = {}
+    for n in sizes:
+        txs = synthetic_transactions(n, seed=seed)
+        transactions.STORE[BENCH_USER["id"]] = txs
+        month, year = txs[-1].tx_date.month, txs[-1].tx_date.year
+        try:
+            results[f"dashboard_summary[n={n}]"] = time_call(
+                lambda: dashboard_summary(month=month, year=year, current_user=BENCH_USER),
+                repeat, min_time,
+            )
+            results[f"spending_by_category[n={n}]"] = time_call(
+                lambda: spending_by_category(from_date=None, to_date=None, current_user=BENCH_USER),
+                repeat, min_time,
+            )
+        finally:
+            transactions.STORE.pop(BENCH_USER["id"], None)
+    return results
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for hot functions")
+    parser.add_argument("--out", default="bench_micro.json")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--quick", action="store_true", help="short batches, for smoke runs")
+    args = parser.parse_args(argv)
+
+    min_time = 0.02 if args.quick else 0.2
+    results = {}
+    results.update(bench_auth(args.repeat, min_time))
+    results.update(bench_rollups(args.sizes, args.seed, args.repeat, min_time))
+
+    for name, r in results.items():
+        print(f"{name:40s} best {r['best_s'] * 1e6:12.1f} us   median {r['median_s'] * 1e6:12.1f} us")
+
+    write_results(args.out, "micro", results, vars(args))
+    return results
+
+
+if __name__ == "__main__":
+    main()
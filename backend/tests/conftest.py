@@ -0,0 +1,35 @@
+import os
+import tempfile
+
+import pytest
+
+# app.core.config / app.core.database require DATABASE_URL at import time
+os.environ.setdefault(
+    "DATABASE_URL",
+    "sqlite:///" + os.path.join(tempfile.gettempdir(), "wealth_test.db"),
+)
+
+
+class FakeClock:
+    """
+    Stand-in for time.monotonic / date.today: returns whatever `now` is set to.
+    """
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limits(monkeypatch):
+    # every TestClient request comes from the same IP; give each test its own buckets
+    from app.core import rate_limit
+
+    monkeypatch.setattr(rate_limit, "backend", rate_limit.InMemoryRateLimitBackend())
@@ -0,0 +1,86 @@
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.main import app
+from app.routers import transactions
+from app.routers.transactions import TransactionOut
+from app.services.analytics_service import _bucket_edges, bucket_count, lttb, net_worth_series
+
+
+def _tx(type_: str, amount: float, d: date) -> TransactionOut:
+    return TransactionOut(
+        id=f"{type_}-{d}", created_at=datetime(2024, 1, 1),
+        type=type_, amount=amount, category="x", tx_date=d,
+    )
+
+
+def test_cumulative_balance_with_opening_and_empty_buckets():
+    txs = [
+        _tx("income", 100, date(2023, 12, 31)),  # before range -> opening balance
+        _tx("income", 1000, date(2024, 1, 1)),
+        _tx("expense", 200, date(2024, 1, 3)),
+        _tx("investment", 50, date(2024, 1, 3)),
+    ]
+    out = net_worth_series(txs, date(2024, 1, 1), date(2024, 1, 4), "day")
+
+    assert out["opening_balance"] == 100
+    assert [p["value"] for p in out["points"]] == [1100, 1100, 950, 950]
+    assert out["downsampled"] is False
+
+
+def test_month_interval_buckets():
+    txs = [_tx("income", 10, date(2024, m, 15)) for m in range(1, 4)]
+    out = net_worth_series(txs, date(2024, 1, 10), date(2024, 3, 20), "month")
+
+    assert [p["date"] for p in out["points"]] == ["2024-01-01", "2024-02-01", "2024-03-01"]
+    assert [p["value"] for p in out["points"]] == [10, 20, 30]
+
+
+def test_long_range_is_downsampled_to_budget():
+    start = date(2015, 1, 1)
+    txs = [_tx("income", 5, start + timedelta(days=i)) for i in range(0, 3650, 3)]
+    out = net_worth_series(txs, start, start + timedelta(days=3649), "day", max_points=200)
+
+    assert out["downsampled"] is True
+    assert len(out["points"]) == 200
+    assert out["points"][0]["date"] == "2015-01-01"
+    assert out["points"][-1]["value"] == 5 * len(txs)
+
+
+def test_lttb_keeps_spike():
+    x = np.arange(100, dtype=float)
+    y = np.zeros(100)
+    y[42] = 50
+    assert 42 in lttb(x, y, 10)
+
+
+@pytest.mark.parametrize("interval", ["day", "week", "month"])
+def test_edges_reach_date_max_without_overflow(interval):
+    start, end = date(9999, 1, 1), date.max
+    edges = _bucket_edges(start, end, interval)
+    assert len(edges) == bucket_count(start, end, interval)
+    assert edges[-1] <= np.datetime64(end)
+
+
+def test_oversized_range_is_rejected():
+    client = TestClient(app)
+    url = f"{settings.API_V1_PREFIX}/analytics/net-worth"
+
+    res = client.get(url, params={"from": "0001-01-01", "to": "9999-12-31", "interval": "day"})
+    assert res.status_code == 400
+    res = client.get(url, params={"from": "0001-01-01", "to": "9999-12-31", "interval": "month"})
+    assert res.status_code == 400
+    res = client.get(url, params={"from": "8500-01-01", "to": "9999-12-31", "interval": "month"})
+    assert res.status_code == 200
+
+
+def test_to_without_from_before_first_transaction(monkeypatch):
+    monkeypatch.setitem(transactions.STORE, "user_1", [_tx("income", 100, date(2024, 5, 1))])
+    res = TestClient(app).get(f"{settings.API_V1_PREFIX}/analytics/net-worth", params={"to": "2024-01-01"})
+
+    assert res.status_code == 200
+    assert res.json()["points"] == [{"date": "2024-01-01", "value": 0.0}]
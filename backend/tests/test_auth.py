@@ -0,0 +1,94 @@
+import uuid
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.database import SessionLocal
+from app.core.reset_tokens import ConsumedTokens
+from app.core.security import hash_password
+from app.main import app
+from app.models.user import User
+
+client = TestClient(app)
+
+
+def _reset_token(email: str) -> str:
+    res = client.post("/api/auth/forgot-password", json={"email": email})
+    return parse_qs(urlparse(res.json()["reset_link"]).query)["token"][0]
+
+
+@pytest.fixture
+def account():
+    email = f"{uuid.uuid4().hex[:12]}@example.com"
+    res = client.post("/api/auth/register", json={"name": "Test", "email": email, "password": "old-pass"})
+    assert res.status_code == 200
+    return email
+
+
+def test_reset_token_is_single_use(account):
+    token = _reset_token(account)
+
+    res = client.post("/api/auth/reset-password", json={"token": token, "new_password": "new-pass"})
+    assert res.status_code == 200
+    res = client.post("/api/auth/reset-password", json={"token": token, "new_password": "other-pass"})
+    assert res.status_code == 400
+
+    assert client.post("/api/auth/login", json={"email": account, "password": "new-pass"}).status_code == 200
+
+
+def test_password_change_invalidates_older_tokens(account):
+    token = _reset_token(account)
+
+    # password changed some other way (e.g. from another worker) after the token was issued
+    db = SessionLocal()
+    user = db.query(User).filter(User.email == account).first()
+    user.password_hash = hash_password("changed-elsewhere")
+    db.commit()
+    db.close()
+
+    res = client.post("/api/auth/reset-password", json={"token": token, "new_password": "other-pass"})
+    assert res.status_code == 400
+    assert res.json()["detail"] == "Token is no longer valid"
+
+
+def test_reset_loses_race_with_concurrent_change(account, monkeypatch):
+    from app.routers import auth_router
+
+    token = _reset_token(account)
+    real_hash = auth_router.hash_password
+
+    def change_elsewhere_first(password):
+        # another worker resets the password between our check and our write
+        db = SessionLocal()
+        db.query(User).filter(User.email == account).update({User.password_hash: real_hash("winner-pass")})
+        db.commit()
+        db.close()
+        return real_hash(password)
+
+    monkeypatch.setattr(auth_router, "hash_password", change_elsewhere_first)
+    res = client.post("/api/auth/reset-password", json={"token": token, "new_password": "loser-pass"})
+    assert res.status_code == 400
+
+    monkeypatch.undo()
+    assert client.post("/api/auth/login", json={"email": account, "password": "winner-pass"}).status_code == 200
+
+
+def test_invalid_token_is_rejected():
+    res = client.post("/api/auth/reset-password", json={"token": "not-a-real-token", "new_password": "new-pass"})
+    assert res.status_code == 400
+
+
+def test_consumed_tokens_expire_and_stay_bounded(clock):
+    consumed = ConsumedTokens(ttl_seconds=60, max_size=2, clock=clock)
+
+    assert consumed.add("a") is True
+    assert consumed.add("a") is False
+
+    clock.now = 61
+    assert "a" not in consumed
+
+    for key in ("b", "c", "d"):
+        consumed.add(key)
+    assert len(consumed) == 2
+    assert "b" not in consumed
@@ -0,0 +1,90 @@
+from datetime import date
+import threading
+
+import pytest
+
+from app.routers import transactions
+from app.routers.budgets import BudgetIn, budget_alerts, budget_status, list_budgets, set_budget
+from app.routers.transactions import TransactionIn, create_transaction, delete_transaction
+from app.services import budget_service
+
+USER = {"id": "budget_user"}
+
+
+@pytest.fixture(autouse=True)
+def clean_stores():
+    for store in (budget_service.BUDGETS, budget_service.SPEND, budget_service.ALERTS, transactions.STORE):
+        store.clear()
+    yield
+    for store in (budget_service.BUDGETS, budget_service.SPEND, budget_service.ALERTS, transactions.STORE):
+        store.clear()
+
+
+def _spend(amount: float, category: str = "Dining", d: date = date(2099, 5, 10)):
+    payload = TransactionIn(type="expense", amount=amount, category=category, tx_date=d)
+    return create_transaction(payload, current_user=USER)
+
+
+def _status(category: str = "Dining") -> dict:
+    items = budget_status(month=5, year=2099, current_user=USER)["budgets"]
+    return next(i for i in items if i["category"] == category)
+
+
+def test_running_spend_follows_create_and_delete():
+    set_budget(BudgetIn(category="Dining", amount=1000), current_user=USER)
+    tx = _spend(300)
+    _spend(200)
+    _spend(999, d=date(2099, 6, 1))  # other month
+    _spend(50, category="Transport")  # other category
+
+    assert _status()["spent"] == 500
+
+    delete_transaction(tx.id, current_user=USER)
+    assert _status() == {
+        "category": "Dining", "budget": 1000, "spent": 200,
+        "remaining": 800, "percent": 20.0, "status": "ok",
+    }
+
+
+def test_alerts_fire_once_per_threshold_crossing():
+    set_budget(BudgetIn(category="Dining", amount=1000), current_user=USER)
+    _spend(700)
+    assert budget_alerts(current_user=USER) == []
+
+    _spend(150)  # 85%
+    _spend(10)   # still 86%, no new alert
+    _spend(200)  # 106%
+
+    thresholds = [a["threshold"] for a in budget_alerts(current_user=USER)]
+    assert thresholds == [100, 80]
+    assert _status()["status"] == "over"
+
+
+def test_lowering_budget_below_spend_alerts_immediately():
+    _spend(500, d=date.today())
+    set_budget(BudgetIn(category="Dining", amount=400), current_user=USER)
+
+    assert [a["threshold"] for a in budget_alerts(current_user=USER)] == [100, 80]
+
+
+def test_status_reads_are_safe_while_budgets_are_added():
+    stop = threading.Event()
+    errors = []
+
+    def reader():
+        try:
+            while not stop.is_set():
+                budget_service.budget_status("u", "2099-05")
+                list_budgets(current_user={"id": "u"})
+        except RuntimeError as e:
+            errors.append(e)
+
+    t = threading.Thread(target=reader)
+    t.start()
+    try:
+        for i in range(20_000):
+            budget_service.set_budget("u", f"c{i}", 100)
+    finally:
+        stop.set()
+        t.join()
+    assert errors == []
@@ -0,0 +1,127 @@
+import asyncio
+import json
+from datetime import date
+
+import pytest
+
+from app.core.events import EventBus, InMemoryEventBackend, RedisEventBackend
+from app.routers import transactions
+from app.routers.dashboard import dashboard_stream, diff_snapshots
+from app.routers.transactions import TransactionIn, create_transaction
+
+USER = {"id": "stream_user"}
+
+
+class FakeRequest:
+    def __init__(self):
+        self.disconnected = False
+
+    async def is_disconnected(self) -> bool:
+        return self.disconnected
+
+
+@pytest.fixture(autouse=True)
+def clean_store():
+    transactions.STORE.clear()
+    yield
+    transactions.STORE.clear()
+
+
+def _parse(chunk: str) -> tuple[str, dict]:
+    event, data = chunk.strip().split("\n")
+    return event.removeprefix("event: "), json.loads(data.removeprefix("data: "))
+
+
+def test_diff_only_contains_changes():
+    old = {"summary": {"income": 1, "expense": 2}, "budgets": {"Dining": {"spent": 5}, "Rent": {"spent": 1}}}
+    new = {"summary": {"income": 1, "expense": 3}, "budgets": {"Dining": {"spent": 5}}}
+
+    assert diff_snapshots(old, new) == {"summary": {"expense": 3}, "budgets": {"Rent": None}}
+    assert diff_snapshots(new, new) == {}
+
+
+def test_bus_coalesces_notifications():
+    async def scenario():
+        bus = EventBus()
+        bus.backend = InMemoryEventBackend(bus)
+        sub = bus.subscribe(["u1"])
+
+        for _ in range(3):
+            bus.publish("u1")
+        bus.publish("someone-else")
+
+        assert await sub.wait(1) is True
+        assert await sub.wait(0.05) is False  # three publishes, one wake-up
+        bus.unsubscribe(sub)
+        assert bus.connection_count() == 0
+
+    asyncio.run(scenario())
+
+
+def test_stream_sends_snapshot_then_diff():
+    async def scenario():
+        request = FakeRequest()
+        response = await dashboard_stream(request, token=None, current_user=USER)
+        stream = response.body_iterator
+
+        assert (await anext(stream)).startswith("retry:")
+        event, snapshot = _parse(await anext(stream))
+        assert event == "snapshot"
+        assert snapshot["summary"]["expense"] == 0
+
+        payload = TransactionIn(type="expense", amount=42, category="Dining", tx_date=date.today())
+        await asyncio.to_thread(create_transaction, payload, current_user=USER)
+
+        event, diff = _parse(await asyncio.wait_for(anext(stream), 5))
+        assert event == "diff"
+        assert diff == {"summary": {"expense": 42.0, "savings": -42.0, "transactions_count": 1}}
+
+        request.disconnected = True
+        await stream.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_redis_publish_never_blocks_the_loop():
+    class SyncClient:
+        def publish(self, channel, key):
+            raise AssertionError("sync publish on the event loop")
+
+    published = []
+
+    class AsyncClient:
+        async def publish(self, channel, key):
+            published.append(key)
+
+    async def scenario():
+        backend = RedisEventBackend(EventBus(), "redis://localhost:1")
+        backend._client, backend._async_client = SyncClient(), AsyncClient()
+        backend.publish("u1")
+        await asyncio.sleep(0)
+
+    asyncio.run(scenario())
+    assert published == ["u1"]
+
+
+def test_redis_listener_reconnects_after_errors():
+    attempts = []
+
+    async def flaky_listen(on_subscribed):
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("redis down")
+        on_subscribed()
+        await asyncio.sleep(3600)
+
+    async def scenario():
+        backend = RedisEventBackend(EventBus(), "redis://localhost:1", min_backoff=0.01, max_backoff=0.02)
+        backend._listen = flaky_listen
+        task = asyncio.create_task(backend.run())
+        while len(attempts) < 3:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(scenario())
+    assert len(attempts) == 3
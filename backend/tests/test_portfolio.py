@@ -0,0 +1,150 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.main import app
+from app.services import market_service, portfolio_service
+from app.services.portfolio_service import portfolio_risk
+
+SYMBOLS = ["AAA", "BBB", "CCC"]
+QTY = {"AAA": 10, "BBB": 5, "CCC": 20}
+START = date(2024, 1, 1)
+
+
+@pytest.fixture(autouse=True)
+def clean_prices():
+    market_service.PRICES.clear()
+    market_service.REVISIONS.clear()
+    portfolio_service._cache.clear()
+    yield
+    market_service.PRICES.clear()
+    market_service.REVISIONS.clear()
+    portfolio_service._cache.clear()
+
+
+def _prices(days: int, seed: int = 7) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0.0005, 0.015, size=(days, len(SYMBOLS)))
+    return 100 * np.cumprod(1 + returns, axis=0)
+
+
+def _load(prices: np.ndarray, first_day: int = 0) -> None:
+    for i, row in enumerate(prices, start=first_day):
+        for symbol, close in zip(SYMBOLS, row):
+            market_service.add_bar(symbol, START + timedelta(days=i), float(close))
+
+
+def _naive(prices: np.ndarray) -> dict:
+    returns = prices[1:] / prices[:-1] - 1
+    values = prices @ np.array([QTY[s] for s in SYMBOLS], dtype=float)
+    p_returns = values[1:] / values[:-1] - 1
+    vol = p_returns.std(ddof=1) * np.sqrt(252)
+    return {
+        "cov": np.cov(returns, rowvar=False) * 252,
+        "corr": np.corrcoef(returns, rowvar=False),
+        "vol": vol,
+        "sharpe": (p_returns.mean() * 252 - settings.RISK_FREE_RATE) / vol,
+        "mdd": (values / np.maximum.accumulate(values) - 1).min(),
+        "asset_mdd": (prices / np.maximum.accumulate(prices, axis=0) - 1).min(axis=0),
+    }
+
+
+def _assert_matches(result: dict, prices: np.ndarray) -> None:
+    expected = _naive(prices)
+    assert result["observations"] == len(prices) - 1
+    np.testing.assert_allclose(result["covariance"], expected["cov"], atol=1e-7)
+    np.testing.assert_allclose(result["correlation"], expected["corr"], atol=1e-4)
+    assert result["portfolio"]["volatility"] == pytest.approx(expected["vol"], abs=1e-6)
+    assert result["portfolio"]["sharpe"] == pytest.approx(expected["sharpe"], abs=1e-4)
+    assert result["portfolio"]["max_drawdown"] == pytest.approx(expected["mdd"], abs=1e-6)
+    for symbol, mdd in zip(SYMBOLS, expected["asset_mdd"]):
+        assert result["assets"][symbol]["max_drawdown"] == pytest.approx(mdd, abs=1e-6)
+
+
+def test_full_build_matches_naive_computation():
+    prices = _prices(300)
+    _load(prices)
+    _assert_matches(portfolio_risk(QTY), prices)
+
+
+def test_new_bars_are_folded_in_incrementally():
+    prices = _prices(300)
+    _load(prices[:250])
+    first = portfolio_risk(QTY)
+    state = portfolio_service._cache[first["portfolio_version"]]
+
+    _load(prices[250:], first_day=250)
+    second = portfolio_risk(QTY)
+
+    assert portfolio_service._cache[second["portfolio_version"]] is state  # same state, updated in place
+    assert second["as_of"] == START + timedelta(days=299)
+    _assert_matches(second, prices)
+
+
+def test_cached_per_version_and_price_date(monkeypatch):
+    computed = []
+    compute = portfolio_service.RiskState._compute
+
+    def counting_compute(self):
+        computed.append(1)
+        return compute(self)
+
+    monkeypatch.setattr(portfolio_service.RiskState, "_compute", counting_compute)
+
+    _load(_prices(50))
+    first = portfolio_risk(QTY)
+    first["portfolio"]["volatility"] = -1.0  # callers may modify their copy
+    again = portfolio_risk(QTY)
+    assert len(computed) == 1
+    assert again["portfolio"]["volatility"] != -1.0
+
+    other = portfolio_risk({**QTY, "AAA": 11})
+    assert other["portfolio_version"] != first["portfolio_version"]
+
+
+def test_rewritten_history_triggers_rebuild():
+    prices = _prices(60)
+    _load(prices)
+    portfolio_risk(QTY)
+
+    prices[10, 0] *= 0.5  # corrected bar for an old date
+    market_service.add_bar("AAA", START + timedelta(days=10), float(prices[10, 0]))
+    _assert_matches(portfolio_risk(QTY), prices)
+
+
+def test_rewrite_only_rebuilds_portfolios_holding_that_symbol():
+    _load(_prices(60))
+    with_aaa = portfolio_risk(QTY)
+    without_aaa = portfolio_risk({"BBB": 5, "CCC": 20})
+    untouched = portfolio_service._cache[without_aaa["portfolio_version"]]
+
+    market_service.add_bar("AAA", START + timedelta(days=10), 1.0)
+    portfolio_risk(QTY)
+    portfolio_risk({"BBB": 5, "CCC": 20})
+
+    assert portfolio_service._cache[with_aaa["portfolio_version"]].revision == (1, 0, 0)
+    assert portfolio_service._cache[without_aaa["portfolio_version"]] is untouched
+
+
+def test_missing_prices_and_partial_dates():
+    _load(_prices(30))
+    market_service.add_bar("AAA", START + timedelta(days=30), 123.0)  # others not in yet
+
+    result = portfolio_risk({**QTY, "ZZZ": 1})
+    assert result["missing_prices"] == ["ZZZ"]
+    assert result["as_of"] == START + timedelta(days=29)
+
+
+def test_price_feed_requires_admin():
+    client = TestClient(app)
+    url = f"{settings.API_V1_PREFIX}/market/bars"
+    bar = [{"symbol": "AAA", "date": "2024-01-01", "close": 1.0}]
+
+    assert client.post(url, json=bar).status_code == 401
+    assert "AAA" not in market_service.PRICES
+    res = client.post(url, json=bar, headers={"Authorization": "Bearer admin-token"})
+    assert res.status_code == 200
+    assert market_service.PRICES["AAA"][1] == [1.0]
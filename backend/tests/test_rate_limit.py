@@ -0,0 +1,87 @@
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.core import rate_limit
+from app.core.rate_limit import InMemoryRateLimitBackend, RateLimit, RateLimitMiddleware
+
+
+def test_bucket_allows_burst_then_refills(clock):
+    clock.now = 1000.0
+    backend = InMemoryRateLimitBackend(clock=clock)
+    limit = RateLimit(capacity=3, per_minute=60)  # 1 token / second
+
+    assert [backend.consume("k", limit) for _ in range(3)] == [0, 0, 0]
+    assert backend.consume("k", limit) == pytest.approx(1.0)
+
+    clock.now += 1
+    assert backend.consume("k", limit) == 0
+    assert backend.consume("k", limit) > 0
+
+
+def test_idle_keys_are_evicted_when_full(clock):
+    backend = InMemoryRateLimitBackend(max_keys=2, clock=clock)
+    limit = RateLimit(capacity=1, per_minute=1)
+
+    backend.consume("a", limit)
+    backend.consume("b", limit)
+    backend.consume("a", limit)  # "a" is now most recently used
+    backend.consume("c", limit)
+
+    assert len(backend) == 2
+    assert backend.consume("b", limit) == 0  # "b" was evicted, starts with a full bucket
+
+
+@pytest.fixture
+def limited_backend(monkeypatch, clock):
+    backend = InMemoryRateLimitBackend(clock=clock)
+    monkeypatch.setattr(rate_limit, "backend", backend)
+    return backend
+
+
+def test_middleware_rejects_before_handler(limited_backend):
+    calls = []
+    app = FastAPI()
+    app.add_middleware(RateLimitMiddleware, limits={"/auth/login": RateLimit(capacity=2, per_minute=1)})
+
+    @app.post("/auth/login")
+    def login():
+        calls.append(1)
+        return {"ok": True}
+
+    client = TestClient(app)
+    codes = [client.post("/auth/login").status_code for _ in range(4)]
+
+    assert codes == [200, 200, 429, 429]
+    assert len(calls) == 2
+    assert client.post("/auth/login").headers["Retry-After"] == "60"
+
+
+def test_throttle_is_per_account(limited_backend):
+    for _ in range(rate_limit.ACCOUNT_LIMITS["login"].capacity):
+        rate_limit.throttle("login", "a@example.com")
+
+    with pytest.raises(HTTPException) as exc:
+        rate_limit.throttle("login", "A@example.com")
+    assert exc.value.status_code == 429
+
+    rate_limit.throttle("login", "b@example.com")
+
+
+def test_middleware_only_uses_async_backend_path(monkeypatch):
+    class AsyncOnlyBackend:
+        def consume(self, key, limit):
+            raise AssertionError("sync consume would block the event loop")
+
+        async def consume_async(self, key, limit):
+            return 0.0
+
+    monkeypatch.setattr(rate_limit, "backend", AsyncOnlyBackend())
+    app = FastAPI()
+    app.add_middleware(RateLimitMiddleware, limits={"/auth/login": RateLimit(capacity=1, per_minute=1)})
+
+    @app.post("/auth/login")
+    def login():
+        return {"ok": True}
+
+    assert TestClient(app).post("/auth/login").status_code == 200
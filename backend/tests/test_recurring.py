@@ -0,0 +1,103 @@
+import asyncio
+from datetime import date
+
+import pytest
+
+from app import main
+from app.routers import recurring, transactions
+from app.routers.dashboard import dashboard_summary
+from app.routers.recurring import RecurringRuleIn, create_rule, materialize_due
+
+
+@pytest.fixture(autouse=True)
+def clean_stores():
+    recurring.RULES.clear()
+    transactions.STORE.clear()
+    yield
+    recurring.RULES.clear()
+    transactions.STORE.clear()
+
+
+def _rule(user_id: str, **kwargs):
+    data = {"type": "income", "amount": 1000, "category": "Salary", "start_date": date(2099, 1, 31)}
+    data.update(kwargs)
+    return create_rule(RecurringRuleIn(**data), current_user={"id": user_id})
+
+
+def test_monthly_rule_clamps_to_month_end(clock):
+    _rule("u1")
+    clock.now = date(2099, 4, 30)
+
+    assert materialize_due(clock) == 4
+    dates = [t.tx_date for t in transactions.STORE["u1"]]
+    assert dates == [date(2099, 1, 31), date(2099, 2, 28), date(2099, 3, 31), date(2099, 4, 30)]
+
+
+def test_materialize_is_idempotent_per_tick(clock):
+    _rule("u1", freq="weekly", start_date=date(2099, 1, 1))
+    clock.now = date(2099, 1, 15)
+
+    assert materialize_due(clock) == 3
+    assert materialize_due(clock) == 0
+
+    clock.now = date(2099, 1, 22)
+    assert materialize_due(clock) == 1
+
+
+def test_batch_covers_all_users_and_respects_until(clock):
+    _rule("u1", freq="daily", interval=2, start_date=date(2099, 1, 1), until=date(2099, 1, 5))
+    _rule("u2", type="expense", category="Rent", amount=500, start_date=date(2099, 1, 1))
+
+    clock.now = date(2099, 3, 1)
+    assert materialize_due(clock) == 6
+    assert len(transactions.STORE["u1"]) == 3
+    assert len(transactions.STORE["u2"]) == 3
+
+
+def test_finished_rules_are_not_rescanned(clock, monkeypatch):
+    _rule("u1", freq="daily", start_date=date(2099, 1, 1), until=date(2099, 1, 3))
+    clock.now = date(2099, 2, 1)
+    assert materialize_due(clock) == 3
+
+    scanned = []
+
+    def recording_due_occurrences(pairs, today):
+        scanned.extend(pairs)
+        return []
+
+    monkeypatch.setattr(recurring, "due_occurrences", recording_due_occurrences)
+    assert materialize_due(clock) == 0
+    assert scanned == []
+
+
+def test_dashboard_reflects_materialized_transactions(clock):
+    _rule("user_1", start_date=date(2099, 1, 1))
+    _rule("user_1", type="expense", category="Rent", amount=400, start_date=date(2099, 1, 5))
+    clock.now = date(2099, 2, 10)
+    materialize_due(clock)
+
+    summary = dashboard_summary(month=2, year=2099, current_user={"id": "user_1"})
+    assert summary["income"] == 1000
+    assert summary["expense"] == 400
+    assert summary["transactions_count"] == 2
+
+
+def test_tick_survives_a_failing_run(monkeypatch):
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return 0
+
+    async def scenario():
+        monkeypatch.setattr(main, "materialize_due", flaky)
+        monkeypatch.setattr(main.settings, "RECURRING_TICK_SECONDS", 0)
+        task = asyncio.create_task(main._recurring_tick())
+        while len(calls) < 2:
+            await asyncio.sleep(0.01)
+        task.cancel()
+
+    asyncio.run(scenario())
+    assert len(calls) >= 2
@@ -0,0 +1,31 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine
+
+from benchmarks.seed import generate_chunk, seed
+
+
+def _chunk(seed_: int, chunk: int) -> dict:
+    return generate_chunk(1, 50, 6, date(2025, 1, 1), seed_, chunk, "2025-01-01 00:00:00")
+
+
+def test_same_seed_and_chunk_give_identical_rows():
+    assert _chunk(42, 0) == _chunk(42, 0)
+    assert _chunk(42, 0) != _chunk(42, 1)
+    assert _chunk(42, 0) != _chunk(7, 0)
+
+
+def test_seed_is_repeatable_and_refuses_overlapping_ids(tmp_path):
+    def load(path):
+        engine = create_engine(f"sqlite:///{path}")
+        seed(engine, users=20, months=3, seed=42, chunk_size=8, end=date(2025, 1, 1))
+        with engine.connect() as conn:
+            # password_hash is salted, everything else must match
+            users = conn.exec_driver_sql("SELECT id, name, email, created_at FROM users ORDER BY id").fetchall()
+            return [users] + [conn.exec_driver_sql(f"SELECT * FROM {t} ORDER BY id").fetchall()
+                              for t in ("transactions", "goals", "investments")]
+
+    assert load(tmp_path / "a.db") == load(tmp_path / "b.db")
+    with pytest.raises(SystemExit):
+        load(tmp_path / "a.db")
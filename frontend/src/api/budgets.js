@@ -0,0 +1,28 @@
+import { api } from "./client";
+
+export async function listBudgets() {
+  const res = await api.get("/api/budgets");
+  return res.data;
+}
+
+export async function setBudget(payload) {
+  // payload: { category, amount } (monthly limit)
+  const res = await api.put("/api/budgets", payload);
+  return res.data;
+}
+
+export async function deleteBudget(category) {
+  const res = await api.delete(`/api/budgets/${encodeURIComponent(category)}`);
+  return res.data;
+}
+
+export async function getBudgetStatus(params = {}) {
+  // params: { month, year } optional
+  const res = await api.get("/api/budgets/status", { params });
+  return res.data;
+}
+
+export async function getBudgetAlerts() {
+  const res = await api.get("/api/budgets/alerts");
+  return res.data;
+}
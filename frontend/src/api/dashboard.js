@@ -5,3 +5,22 @@ export async function getDashboardSummary(params = {}) {
   const res = await api.get("/api/dashboard/summary", { params });
   return res.data;
 }
+
+export async function getNetWorthHistory(params = {}) {
+  // params: { from, to, interval: "day" | "week" | "month", max_points } optional
+  const res = await api.get("/api/analytics/net-worth", { params });
+  return res.data;
+}
+
+export function subscribeDashboard({ onSnapshot, onDiff } = {}) {
+  // Live updates instead of polling: full snapshot first, then only changed entries.
+  // Returns the EventSource; call .close() on unmount.
+  const token = localStorage.getItem("access_token");
+  const url = new URL("/api/dashboard/stream", api.defaults.baseURL);
+  if (token) url.searchParams.set("token", token);
+
+  const source = new EventSource(url.toString());
+  source.addEventListener("snapshot", (e) => onSnapshot?.(JSON.parse(e.data)));
+  source.addEventListener("diff", (e) => onDiff?.(JSON.parse(e.data)));
+  return source;
+}
@@ -0,0 +1,12 @@
+import { api } from "./client";
+
+export async function getPortfolio() {
+  const res = await api.get("/api/portfolio");
+  return res.data;
+}
+
+export async function getPortfolioRisk() {
+  // volatility, max drawdown, Sharpe, covariance/correlation across holdings
+  const res = await api.get("/api/portfolio/risk");
+  return res.data;
+}
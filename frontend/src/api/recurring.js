@@ -0,0 +1,17 @@
+import { api } from "./client";
+
+export async function listRecurringRules() {
+  const res = await api.get("/api/recurring");
+  return res.data;
+}
+
+export async function createRecurringRule(payload) {
+  // payload: { type, amount, category, note, freq, interval, start_date, until }
+  const res = await api.post("/api/recurring", payload);
+  return res.data;
+}
+
+export async function deleteRecurringRule(ruleId) {
+  const res = await api.delete(`/api/recurring/${ruleId}`);
+  return res.data;
+}